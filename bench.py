@@ -0,0 +1,107 @@
+import argparse
+import json
+import sys
+import time
+from typing import List
+from main import day_registry
+from utils.BenchmarkStatistics import BenchmarkStatistics, format_nanoseconds
+from utils.ParseCache import parse_cache
+from utils.NumpyGrid import numpy_grid_settings
+from utils.require_numpy import require_numpy
+
+
+def positive_integer(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def day_number(value: str) -> int:
+    number = int(value)
+    if not 1 <= number <= 25:
+        raise argparse.ArgumentTypeError(f"{value} is not a day between 1 and 25")
+    return number
+
+
+def time_solution_runs(day: int, is_official: bool, runs: int, warmups: int) -> BenchmarkStatistics:
+    solve_function = day_registry.get_solve_function(day)
+    for _ in range(warmups):
+        solve_function(is_official)
+    samples: List[int] = []
+    for _ in range(runs):
+        start_time = time.perf_counter_ns()
+        solve_function(is_official)
+        end_time = time.perf_counter_ns()
+        samples.append(end_time - start_time)
+    return BenchmarkStatistics(day, samples)
+
+
+def benchmark_days(days: List[int], is_official: bool, runs: int, warmups: int) -> List[BenchmarkStatistics]:
+    all_statistics: List[BenchmarkStatistics] = []
+    for day in days:
+        day_statistics = time_solution_runs(day, is_official, runs, warmups)
+        print(day_statistics)
+        all_statistics.append(day_statistics)
+    return all_statistics
+
+
+def write_baseline(path: str, all_statistics: List[BenchmarkStatistics], is_official: bool) -> None:
+    baseline = {
+        "is_official": is_official,
+        "days": {str(day_statistics.day): day_statistics.convert_to_dict() for day_statistics in all_statistics}
+    }
+    file = open(path, "w")
+    json.dump(baseline, file, indent=4)
+    file.close()
+
+
+def read_baseline(path: str) -> dict[str, dict[str, float]]:
+    file = open(path, "r")
+    baseline = json.load(file)
+    file.close()
+    return baseline["days"]
+
+
+def find_regressions(all_statistics: List[BenchmarkStatistics], baseline: dict[str, dict[str, float]], threshold: float) -> List[str]:
+    regressions: List[str] = []
+    for day_statistics in all_statistics:
+        previous = baseline.get(str(day_statistics.day))
+        if previous is None:
+            continue
+        previous_median = previous["median"]
+        change = (day_statistics.median - previous_median) / previous_median * 100 if previous_median else 0.0
+        if change > threshold:
+            regressions.append(f"Day {day_statistics.day}: median {format_nanoseconds(previous_median)} -> {format_nanoseconds(day_statistics.median)} (+{change:.1f}%)")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark solutions with repeated runs")
+    parser.add_argument("days", type=day_number, nargs="*", help="Select which days to benchmark (defaults to every day)")
+    parser.add_argument("--practice", action="store_true", help="Benchmark against the practice data instead of the final data")
+    parser.add_argument("--runs", type=positive_integer, default=10, help="Number of timed runs per day")
+    parser.add_argument("--warmups", type=int, default=2, help="Number of untimed runs per day before timing starts")
+    parser.add_argument("--output", help="Write the results to this JSON baseline file")
+    parser.add_argument("--compare", help="Compare the results against this JSON baseline file")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percentage increase in median time flagged as a regression when comparing")
+    parser.add_argument("--no-cache", action="store_true", help="Parse each input from scratch instead of loading it from the parse cache")
+    parser.add_argument("--numpy", action="store_true", help="Use the vectorized NumPy grid engine for the grid days that support it (requires NumPy)")
+    args = parser.parse_args()
+    parse_cache.enabled = not args.no_cache
+    if args.numpy:
+        require_numpy()
+        numpy_grid_settings.enabled = True
+    selected_days = args.days if args.days else day_registry.days
+    all_statistics = benchmark_days(selected_days, not args.practice, args.runs, args.warmups)
+    if args.output:
+        write_baseline(args.output, all_statistics, not args.practice)
+    if args.compare:
+        regressions = find_regressions(all_statistics, read_baseline(args.compare), args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS (median slower by more than {args.threshold}%)")
+            for regression in regressions:
+                print(regression)
+            sys.exit(1)
+        else:
+            print(f"\nNo regressions beyond {args.threshold}%")
@@ -0,0 +1,24 @@
+import random
+import string
+from typing import List
+from day_1.solution import word_digits
+
+
+def generate_line(randomizer: random.Random) -> str:
+    pieces: List[str] = [str(randomizer.randint(1, 9))]
+    for _ in range(randomizer.randint(1, 8)):
+        roll = randomizer.random()
+        if roll < 0.3:
+            pieces.append(str(randomizer.randint(1, 9)))
+        elif roll < 0.6:
+            pieces.append(randomizer.choice(word_digits))
+        else:
+            pieces.append("".join(randomizer.choice(string.ascii_lowercase) for _ in range(randomizer.randint(1, 5))))
+    randomizer.shuffle(pieces)
+    return "".join(pieces)
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    lines = [generate_line(randomizer) for _ in range(1000 * scale)]
+    return "\n".join(lines)
@@ -1,86 +1,94 @@
-import time
-from typing import List
-from utils.get_list_of_lines import get_list_of_lines
+from contextlib import ExitStack
+from typing import Iterable, List
+from utils.map_data_from_file import map_data_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 numeral_digits = [1, 2, 3, 4, 5, 6, 7, 8, 9]
 word_digits = ['one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
 
 
-class NumberInLine:
-    def __init__(self, value: int | str, index: int) -> None:
-        self.value = value
-        self.index = index
-
-    def __repr__(self) -> str:
-        return f"Value {self.value} at index {self.index}"
+class DigitScanner:
+    def __init__(self, tokens: dict[bytes, int]) -> None:
+        self.transitions: List[List[int]] = [[0] * 256]
+        self.values: List[int] = [0]
+        self.failures: List[int] = [0]
+        self.build_trie(tokens)
+        self.resolve_transitions()
+
+    def build_trie(self, tokens: dict[bytes, int]) -> None:
+        for token, value in tokens.items():
+            state = 0
+            for byte in token:
+                if not self.transitions[state][byte]:
+                    self.transitions.append([0] * 256)
+                    self.values.append(0)
+                    self.failures.append(0)
+                    self.transitions[state][byte] = len(self.transitions) - 1
+                state = self.transitions[state][byte]
+            self.values[state] = value
+
+    def resolve_transitions(self) -> None:
+        queue = [state for state in self.transitions[0] if state]
+        for state in queue:
+            failure = self.failures[state]
+            if not self.values[state]:
+                self.values[state] = self.values[failure]
+            for byte in range(256):
+                next_state = self.transitions[state][byte]
+                if next_state:
+                    self.failures[next_state] = self.transitions[failure][byte]
+                    queue.append(next_state)
+                else:
+                    self.transitions[state][byte] = self.transitions[failure][byte]
+
+    def find_first_value(self, line: Iterable[int]) -> int:
+        transitions = self.transitions
+        values = self.values
+        state = 0
+        for byte in line:
+            state = transitions[state][byte]
+            if values[state]:
+                return values[state]
+        return 0
+
+
+def create_tokens(words_possible: bool, reverse: bool) -> dict[bytes, int]:
+    tokens: dict[bytes, int] = {}
+    for digit in numeral_digits:
+        tokens[str(digit).encode()] = digit
+    if words_possible:
+        for index in range(len(word_digits)):
+            word = word_digits[index][::-1] if reverse else word_digits[index]
+            tokens[word.encode()] = index + 1
+    return tokens
+
+
+forward_scanners = {words_possible: DigitScanner(create_tokens(words_possible, False)) for words_possible in [False, True]}
+backward_scanners = {words_possible: DigitScanner(create_tokens(words_possible, True)) for words_possible in [False, True]}
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    words_not_possible_calibration_sum = get_calibration_sum_based_on_word_possibility(False, is_official)
-    words_possible_calibration_sum = get_calibration_sum_based_on_word_possibility(True, is_official)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(1, words_not_possible_calibration_sum, words_possible_calibration_sum, execution_time)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    with ExitStack() as mapped_inputs:
+        part_1_input = mapped_inputs.enter_context(map_data_from_file(1, is_official, 1))
+        part_2_input = part_1_input if is_official else mapped_inputs.enter_context(map_data_from_file(1, is_official, 2))
+        timer.start_phase("part_1")
+        words_not_possible_calibration_sum = get_calibration_sum_based_on_word_possibility(False, part_1_input.iterate_lines())
+        timer.start_phase("part_2")
+        words_possible_calibration_sum = get_calibration_sum_based_on_word_possibility(True, part_2_input.iterate_lines())
+        execution_time = timer.stop()
+    results = SolutionResults(1, words_not_possible_calibration_sum, words_possible_calibration_sum, execution_time, timer.phases)
     return results
 
 
-def get_calibration_sum_based_on_word_possibility(words_possible: bool, is_official: bool) -> int:
+def get_calibration_sum_based_on_word_possibility(words_possible: bool, lines: Iterable[bytes]) -> int:
+    forward_scanner = forward_scanners[words_possible]
+    backward_scanner = backward_scanners[words_possible]
     total = 0
-    part_number = 2 if words_possible else 1
-    chunks = extract_data_from_file_based_on_part(1, part_number, is_official)
-    lines = get_list_of_lines(chunks)
     for line in lines:
-        numbers_in_line = find_all_numbers_in_line(line, words_possible)
-        final_digit = combine_first_and_last_numbers_from_line_into_new_number(
-            numbers_in_line)
-        total += final_digit
+        first_number = forward_scanner.find_first_value(line)
+        last_number = backward_scanner.find_first_value(reversed(line))
+        total += first_number * 10 + last_number
     return total
-
-
-def combine_first_and_last_numbers_from_line_into_new_number(numbers_array: List[NumberInLine]) -> int:
-    first_and_last_numbers = determine_first_and_last_numbers_for_line(
-        numbers_array)
-    first_number = first_and_last_numbers[0]
-    last_number = first_and_last_numbers[1]
-    composite_string = str(first_number) + str(last_number)
-    composite_number = int(composite_string)
-    return composite_number
-
-
-def determine_first_and_last_numbers_for_line(numbers_array: List[NumberInLine]) -> List[int]:
-    sorted_substrings = sorted(numbers_array, key=lambda x: x.index)
-    first_number_obj = sorted_substrings[0]
-    last_number_obj = sorted_substrings[-1]
-    first_number = int(first_number_obj.value if str(first_number_obj.value).isdigit(
-    ) else convert_string_to_number(str(first_number_obj.value)))
-    last_number = int(last_number_obj.value if str(last_number_obj.value).isdigit(
-    ) else convert_string_to_number(str(last_number_obj.value)))
-    return [first_number, last_number]
-
-
-def convert_string_to_number(digit: str) -> int:
-    index = word_digits.index(digit)
-    value = index + 1
-    return value
-
-
-def find_all_numbers_in_line(line: str, words_possible: bool) -> List[NumberInLine]:
-    numbers_in_line: List[NumberInLine] = []
-    digits = numeral_digits + word_digits if words_possible else numeral_digits
-    for digit in digits:
-        index = line.find(str(digit))
-        while index != -1:
-            number_in_line = NumberInLine(digit, index)
-            numbers_in_line.append(number_in_line)
-            index = line.find(str(digit), index + 1)
-    return numbers_in_line
-
-
-def extract_data_from_file_based_on_part(day_number: int, part_number: int, is_official: bool) -> str:
-    name = "data" if is_official else f"practice_{part_number}"
-    file = open(f"day_{day_number}/{name}.txt", "r")
-    data = file.read()
-    file.close()
-    return data
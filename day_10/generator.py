@@ -0,0 +1,95 @@
+import random
+from typing import List, Set, Tuple
+
+Position = Tuple[int, int]
+
+pipes_by_directions = {
+    ((0, -1), (0, 1)): "|",
+    ((-1, 0), (1, 0)): "-",
+    ((0, -1), (1, 0)): "L",
+    ((-1, 0), (0, -1)): "J",
+    ((-1, 0), (0, 1)): "7",
+    ((0, 1), (1, 0)): "F"
+}
+filler_characters = "|-LJ7F..."
+
+
+def find_neighbors(position: Position, side: int) -> List[Position]:
+    x, y = position
+    candidates = [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+    return [(nx, ny) for nx, ny in candidates if 0 <= nx < side and 0 <= ny < side]
+
+
+def grow_region(randomizer: random.Random, side: int, target_size: int) -> Set[Position]:
+    start = (randomizer.randrange(side), randomizer.randrange(side))
+    region: Set[Position] = {start}
+    frontier = find_neighbors(start, side)
+    while frontier and len(region) < target_size:
+        index = randomizer.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        position = frontier.pop()
+        if position not in region:
+            region.add(position)
+            frontier.extend(find_neighbors(position, side))
+    return region
+
+
+def build_spanning_tree(randomizer: random.Random, region: Set[Position], side: int) -> List[Tuple[Position, Position]]:
+    start = min(region)
+    visited: Set[Position] = {start}
+    frontier = [(start, neighbor) for neighbor in find_neighbors(start, side) if neighbor in region]
+    tree_edges: List[Tuple[Position, Position]] = []
+    while frontier:
+        index = randomizer.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        source, destination = frontier.pop()
+        if destination not in visited:
+            visited.add(destination)
+            tree_edges.append((source, destination))
+            frontier.extend((destination, neighbor) for neighbor in find_neighbors(destination, side) if neighbor in region and neighbor not in visited)
+    return tree_edges
+
+
+def join(first: Position, second: Position) -> Tuple[Position, Position]:
+    return (first, second) if first < second else (second, first)
+
+
+def trace_loop_around_tree(region: Set[Position], tree_edges: List[Tuple[Position, Position]]) -> Set[Tuple[Position, Position]]:
+    perimeter = [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2), (0, 1)]
+    loop_edges: Set[Tuple[Position, Position]] = set()
+    for x, y in region:
+        corners = [(3 * x + dx, 3 * y + dy) for dx, dy in perimeter]
+        loop_edges.update(join(corners[index - 1], corners[index]) for index in range(len(corners)))
+    for source, destination in tree_edges:
+        (x1, y1), (x2, y2) = sorted([source, destination])
+        if y1 == y2:
+            first_pair = (3 * x1 + 2, 3 * y1), (3 * x2, 3 * y2)
+            second_pair = (3 * x1 + 2, 3 * y1 + 1), (3 * x2, 3 * y2 + 1)
+        else:
+            first_pair = (3 * x1, 3 * y1 + 2), (3 * x2, 3 * y2)
+            second_pair = (3 * x1 + 1, 3 * y1 + 2), (3 * x2 + 1, 3 * y2)
+        loop_edges -= {join(first_pair[0], second_pair[0]), join(first_pair[1], second_pair[1])}
+        loop_edges |= {join(*first_pair), join(*second_pair)}
+    return loop_edges
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    coarse_side = 7 * scale
+    side = 3 * coarse_side
+    region = grow_region(randomizer, coarse_side, coarse_side * coarse_side * 3 // 5)
+    loop_edges = trace_loop_around_tree(region, build_spanning_tree(randomizer, region, coarse_side))
+    directions: dict[Position, List[Position]] = {}
+    for (x1, y1), (x2, y2) in loop_edges:
+        directions.setdefault((x1, y1), []).append((x2 - x1, y2 - y1))
+        directions.setdefault((x2, y2), []).append((x1 - x2, y1 - y2))
+    rows = [[randomizer.choice(filler_characters) for _ in range(side)] for _ in range(side)]
+    for (x, y), pipe_directions in directions.items():
+        first_direction, second_direction = sorted(pipe_directions)
+        rows[y][x] = pipes_by_directions[(first_direction, second_direction)]
+    start_x, start_y = randomizer.choice(sorted(directions))
+    rows[start_y][start_x] = "S"
+    for x, y in find_neighbors((start_x, start_y), side):
+        if (x, y) not in directions:
+            rows[y][x] = "."
+    return "\n".join("".join(row) for row in rows)
@@ -1,160 +1,92 @@
-import time
-from typing import List
+from functools import cached_property
+from typing import Tuple
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.Grid import Grid
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
-
-class Tile:
-    def __init__(self, x: int, y: int, content: str) -> None:
-        self.x = x
-        self.y = y
-        self.content = content
-        self.name = f"x{self.x}y{self.y}"
-        self.included_in_loop = False
-        self.distance_from_start = 0
-        self.connecting_tile_names = self.determine_connecting_tile_names()
-
-    def __repr__(self) -> str:
-        return f"({self.x}, {self.y}): {self.content}"
-
-    def determine_adjacent_tile_name_in_direction(self, x_change: int, y_change: int) -> str:
-        new_x = self.x + x_change
-        new_y = self.y + y_change
-        adjacent_tile = f"x{new_x}y{new_y}"
-        return adjacent_tile
-
-    def determine_all_adjacent_tile_names(self) -> dict[str, str]:
-        north = self.determine_adjacent_tile_name_in_direction(0, -1)
-        south = self.determine_adjacent_tile_name_in_direction(0, 1)
-        east = self.determine_adjacent_tile_name_in_direction(1, 0)
-        west = self.determine_adjacent_tile_name_in_direction(-1, 0)
-        adjacent_tile_names = {
-            "north": north,
-            "south": south,
-            "east": east,
-            "west": west
-        }
-        return adjacent_tile_names
-
-    def determine_connecting_tile_names(self) -> List[str]:
-        adjacent_tile_names = self.determine_all_adjacent_tile_names()
-        north = adjacent_tile_names["north"]
-        south = adjacent_tile_names["south"]
-        east = adjacent_tile_names["east"]
-        west = adjacent_tile_names["west"]
-        if self.content == "|":
-            connecting_tile_names = [north, south]
-        elif self.content == "-":
-            connecting_tile_names = [east, west]
-        elif self.content == "L":
-            connecting_tile_names = [north, east]
-        elif self.content == "J":
-            connecting_tile_names = [north, west]
-        elif self.content == "7":
-            connecting_tile_names = [south, west]
-        elif self.content == "F":
-            connecting_tile_names = [south, east]
-        else:
-            connecting_tile_names = []
-        return connecting_tile_names
-
-    def set_content_by_directions(self, directions: List[str]) -> None:
-        if "north" in directions and "south" in directions:
-            self.content = "|"
-        elif "east" in directions and "west" in directions:
-            self.content = "-"
-        elif "north" in directions and "east" in directions:
-            self.content = "L"
-        elif "north" in directions and "west" in directions:
-            self.content = "J"
-        elif "south" in directions and "west" in directions:
-            self.content = "7"
-        elif "south" in directions and "east" in directions:
-            self.content = "F"
+north = 1
+south = 2
+west = 4
+east = 8
+opposite_directions = {north: south, south: north, west: east, east: west}
+direction_changes = {north: (0, -1), south: (0, 1), west: (-1, 0), east: (1, 0)}
+pipe_connections = {"|": north | south, "-": west | east, "L": north | east, "J": north | west, "7": south | west, "F": south | east}
+connection_table = bytes(pipe_connections.get(chr(code), 0) for code in range(256))
 
 
 class Maze:
     def __init__(self, description: str) -> None:
-        self.rows = get_list_of_lines(description)
-        self.height = self.calculate_height()
-        self.width = self.calculate_width()
-        self.tiles = self.create_tiles()
-        self.maximum_distance_from_start = self.traverse_loop()
-        self.total_inside_count = self.traverse_maze_for_inside_count()
-
-    def calculate_height(self) -> int:
-        return len(self.rows)
-
-    def calculate_width(self) -> int:
-        return len(self.rows[0])
-
-    def create_tiles(self) -> dict[str, Tile]:
-        tiles: dict[str, Tile] = {}
-        for row in range(self.height):
-            for column in range(self.width):
-                character = self.rows[row][column]
-                name = f"x{column}y{row}"
-                new_tile = Tile(column, row, character)
-                tiles[name] = new_tile
-                if character == "S":
-                    self.start_tile = new_tile
-                    self.start_tile.included_in_loop = True
-        return tiles
-
-    def find_tiles_connected_to_start(self) -> List[Tile]:
-        connected_tiles: List[Tile] = []
-        adjacent_names = self.start_tile.determine_all_adjacent_tile_names()
-        directional_keys: List[str] = []
-        for [k, v] in adjacent_names.items():
-            potential_tile = self.tiles.get(v)
-            if potential_tile and self.start_tile.name in potential_tile.connecting_tile_names:
-                connected_tiles.append(potential_tile)
-                directional_keys.append(k)
-        self.start_tile.set_content_by_directions(directional_keys)
-        return connected_tiles
-
-    def traverse_loop(self) -> int:
-        layer = 0
-        tiles_at_layer = self.find_tiles_connected_to_start()
-        while len(tiles_at_layer):
-            layer += 1
-            next_layer: List[Tile] = []
-            for tile in tiles_at_layer:
-                tile.distance_from_start = layer
-                tile.included_in_loop = True
-                connected_names = tile.connecting_tile_names
-                for name in connected_names:
-                    potential_tile = self.tiles.get(name)
-                    if potential_tile and not potential_tile.included_in_loop:
-                        next_layer.append(potential_tile)
-            tiles_at_layer = next_layer
-        return layer
-
-    def traverse_maze_for_inside_count(self) -> int:
-        inside_count = 0
-        for row in range(self.height):
-            crossed_loop_count = 0
-            for column in range(self.width):
-                name = f"x{column}y{row}"
-                tile = self.tiles.get(name)
-                if tile:
-                    if tile.included_in_loop:
-                        if tile.content == "|" or tile.content == "J" or tile.content == "L":
-                            crossed_loop_count += 1
-                    else:
-                        if crossed_loop_count % 2 == 1:
-                            inside_count += 1
-        return inside_count
+        grid = Grid(get_list_of_lines(description))
+        self.stride = grid.stride
+        self.connections = grid.contents.translate(connection_table)
+        self.start_index = grid.contents.index(b"S")
+        self.start_x, self.start_y = grid.find_coordinates(self.start_index)
+        self.connections[self.start_index] = self.determine_start_connections()
+
+    def find_adjacent_index(self, index: int, direction: int) -> int:
+        x_change, y_change = direction_changes[direction]
+        return index + y_change * self.stride + x_change
+
+    def determine_start_connections(self) -> int:
+        start_connections = 0
+        for direction, opposite_direction in opposite_directions.items():
+            if self.connections[self.find_adjacent_index(self.start_index, direction)] & opposite_direction:
+                start_connections |= direction
+        return start_connections
+
+    @cached_property
+    def loop_measurements(self) -> Tuple[int, int]:
+        return self.walk_loop()
+
+    def walk_loop(self) -> Tuple[int, int]:
+        for direction in direction_changes:
+            if self.connections[self.start_index] & direction:
+                measurements = self.walk_loop_from_start(direction)
+                if measurements is not None:
+                    return measurements
+        raise ValueError("No loop of pipes leads back to the start tile")
+
+    def walk_loop_from_start(self, direction: int) -> Tuple[int, int] | None:
+        connections = self.connections
+        index = self.start_index
+        x = self.start_x
+        y = self.start_y
+        length = 0
+        twice_area = 0
+        while True:
+            x_change, y_change = direction_changes[direction]
+            index += y_change * self.stride + x_change
+            twice_area += x * (y + y_change) - (x + x_change) * y
+            x += x_change
+            y += y_change
+            length += 1
+            if index == self.start_index:
+                break
+            if not connections[index] & opposite_directions[direction]:
+                return None
+            direction = connections[index] & ~opposite_directions[direction]
+        return length, abs(twice_area) // 2
+
+    def determine_maximum_distance_from_start(self) -> int:
+        loop_length, _ = self.loop_measurements
+        return loop_length // 2
+
+    def count_inside_tiles(self) -> int:
+        loop_length, loop_area = self.loop_measurements
+        return loop_area - loop_length // 2 + 1
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(10, is_official)
-    maze = Maze(data)
-    part_1 = maze.maximum_distance_from_start
-    part_2 = maze.total_inside_count
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(10, part_1, part_2, execution_time)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    maze = parse_cache.load_or_parse(10, is_official, lambda: Maze(extract_data_from_file(10, is_official)))
+    timer.start_phase("part_1")
+    part_1 = maze.determine_maximum_distance_from_start()
+    timer.start_phase("part_2")
+    part_2 = maze.count_inside_tiles()
+    execution_time = timer.stop()
+    results = SolutionResults(10, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,14 @@
+import random
+from typing import List
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    side = 20 * scale
+    empty_rows = set(randomizer.sample(range(side), side // 10))
+    empty_columns = set(randomizer.sample(range(side), side // 10))
+    rows: List[str] = []
+    for row in range(side):
+        cells = ["#" if row not in empty_rows and column not in empty_columns and randomizer.random() < 0.03 else "." for column in range(side)]
+        rows.append("".join(cells))
+    return "\n".join(rows)
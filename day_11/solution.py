@@ -1,8 +1,11 @@
-import time
-from typing import List
+from functools import cached_property
+from typing import List, Tuple
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.NumpyGrid import NumpyArray, NumpyGrid, numpy_grid_settings, count_by_row, count_by_column, find_positions
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Galaxy:
@@ -11,44 +14,23 @@ class Galaxy:
         self.y = y
 
 
-class GalaxyPair:
-    def __init__(self, first_galaxy: Galaxy, second_galaxy: Galaxy, horizontal_gaps: List[int], vertical_gaps: List[int], expansion_factor: int) -> None:
-        self.first_galaxy = first_galaxy
-        self.second_galaxy = second_galaxy
-        self.horizontal_gaps = horizontal_gaps
-        self.vertical_gaps = vertical_gaps
-        self.expansion_factor = expansion_factor
-        self.distance = self.calculate_expanded_distance()
+def sum_pairwise_distances(sorted_values: List[int]) -> int:
+    total = 0
+    preceding_sum = 0
+    for index in range(len(sorted_values)):
+        total += sorted_values[index] * index - preceding_sum
+        preceding_sum += sorted_values[index]
+    return total
 
-    def calculate_initial_distance(self) -> int:
-        horizontal_change = abs(self.first_galaxy.x - self.second_galaxy.x)
-        vertical_change = abs(self.first_galaxy.y - self.second_galaxy.y)
-        distance = horizontal_change + vertical_change
-        return distance
 
-    def determine_gaps_along_dimension(self, is_vertical: bool) -> int:
-        known_gaps = self.vertical_gaps if is_vertical else self.horizontal_gaps
-        endpoints = sorted([self.first_galaxy.y, self.second_galaxy.y]) if is_vertical else sorted([self.first_galaxy.x, self.second_galaxy.x])
-        gaps_between_endpoints = 0
-        for gap in known_gaps:
-            if gap in range(*endpoints):
-                gaps_between_endpoints += 1
-        return gaps_between_endpoints
-
-    def determine_vertical_gaps(self) -> int:
-        return self.determine_gaps_along_dimension(True)
-
-    def determine_horizontal_gaps(self) -> int:
-        return self.determine_gaps_along_dimension(False)
-
-    def determine_total_gaps(self) -> int:
-        return self.determine_vertical_gaps() + self.determine_horizontal_gaps()
-
-    def calculate_expanded_distance(self) -> int:
-        initial_distance = self.calculate_initial_distance()
-        total_gaps = self.determine_total_gaps()
-        distance = initial_distance + total_gaps * (self.expansion_factor - 1)
-        return distance
+def count_preceding_gaps(gaps: List[int], length: int) -> List[int]:
+    gap_flags = [0] * length
+    for gap in gaps:
+        gap_flags[gap] = 1
+    preceding_gaps = [0] * length
+    for index in range(1, length):
+        preceding_gaps[index] = preceding_gaps[index - 1] + gap_flags[index - 1]
+    return preceding_gaps
 
 
 class Image:
@@ -60,6 +42,11 @@ class Image:
         self.empty_rows = self.determine_rows_without_galaxies()
         self.empty_columns = self.determine_columns_without_galaxies()
         self.galaxies = self.create_galaxies()
+        self.initial_distance, self.gap_distance = self.determine_distance_components()
+
+    @cached_property
+    def galaxy_mask(self) -> NumpyArray:
+        return NumpyGrid(self.rows).create_mask("#")
 
     def calculate_initial_height(self) -> int:
         return len(self.rows)
@@ -77,6 +64,8 @@ class Image:
         return columns
 
     def create_galaxies(self) -> List[Galaxy]:
+        if numpy_grid_settings.enabled:
+            return [Galaxy(x, y) for x, y in find_positions(self.galaxy_mask)]
         galaxies: List[Galaxy] = []
         for row in range(self.height):
             for column in range(self.width):
@@ -86,9 +75,15 @@ class Image:
         return galaxies
 
     def determine_rows_without_galaxies(self) -> List[int]:
+        if numpy_grid_settings.enabled:
+            galaxy_counts = count_by_row(self.galaxy_mask)
+            return [row for row in range(self.height) if galaxy_counts[row] == 0]
         return self.determine_elements_without_galaxies(self.rows)
 
     def determine_columns_without_galaxies(self) -> List[int]:
+        if numpy_grid_settings.enabled:
+            galaxy_counts = count_by_column(self.galaxy_mask)
+            return [column for column in range(self.width) if galaxy_counts[column] == 0]
         return self.determine_elements_without_galaxies(self.columns)
 
     def determine_elements_without_galaxies(self, elements: List[str]) -> List[int]:
@@ -98,31 +93,30 @@ class Image:
                 elements_without_galaxies.append(element_index)
         return elements_without_galaxies
 
-    def find_distances_between_galaxy_pairs_with_expansion(self, expansion_factor: int) -> List[int]:
-        minimal_distances: List[int] = []
-        for index in range(len(self.galaxies)):
-            matching_index = index + 1
-            while matching_index < len(self.galaxies):
-                distance = GalaxyPair(self.galaxies[index], self.galaxies[matching_index], self.empty_columns, self.empty_rows, expansion_factor).distance
-                minimal_distances.append(distance)
-                matching_index += 1
-        return minimal_distances
+    def determine_distance_components(self) -> Tuple[int, int]:
+        rows_before = count_preceding_gaps(self.empty_rows, self.height)
+        columns_before = count_preceding_gaps(self.empty_columns, self.width)
+        ys = sorted(galaxy.y for galaxy in self.galaxies)
+        xs = sorted(galaxy.x for galaxy in self.galaxies)
+        initial_distance = sum_pairwise_distances(ys) + sum_pairwise_distances(xs)
+        gap_distance = sum_pairwise_distances([rows_before[y] for y in ys]) + sum_pairwise_distances([columns_before[x] for x in xs])
+        return initial_distance, gap_distance
+
+    def calculate_total_distances_with_expansions(self, expansion_factors: List[int]) -> List[int]:
+        return [self.initial_distance + self.gap_distance * (expansion_factor - 1) for expansion_factor in expansion_factors]
 
     def calculate_total_distances_with_expansion(self, expansion_factor: int) -> int:
-        total_minimal_distances = 0
-        minimal_distances = self.find_distances_between_galaxy_pairs_with_expansion(expansion_factor)
-        for distance in minimal_distances:
-            total_minimal_distances += distance
-        return total_minimal_distances
+        return self.calculate_total_distances_with_expansions([expansion_factor])[0]
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(11, is_official)
-    image = Image(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    image = parse_cache.load_or_parse(11, is_official, lambda: Image(extract_data_from_file(11, is_official)))
+    timer.start_phase("part_1")
     part_1 = image.calculate_total_distances_with_expansion(2)
+    timer.start_phase("part_2")
     part_2 = image.calculate_total_distances_with_expansion(1000000)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(11, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(11, part_1, part_2, execution_time, timer.phases)
     return results
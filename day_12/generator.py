@@ -0,0 +1,21 @@
+import random
+from typing import List
+
+
+def generate_record(randomizer: random.Random) -> str:
+    groups = [randomizer.randint(1, 4) for _ in range(randomizer.randint(1, 5))]
+    gaps = [0] + [1] * (len(groups) - 1) + [0]
+    for _ in range(randomizer.randint(0, max(0, 20 - sum(groups) - len(groups) + 1))):
+        gaps[randomizer.randrange(len(gaps))] += 1
+    conditions: List[str] = []
+    for group, gap in zip(groups, gaps):
+        conditions.append("." * gap + "#" * group)
+    conditions.append("." * gaps[-1])
+    damaged_conditions = "".join("?" if randomizer.random() < 0.4 else condition for condition in "".join(conditions))
+    return f"{damaged_conditions} {','.join(str(group) for group in groups)}"
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    records = [generate_record(randomizer) for _ in range(200 * scale)]
+    return "\n".join(records)
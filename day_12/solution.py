@@ -1,9 +1,8 @@
-import time
 from functools import cache
-from typing import List
-from utils.get_list_of_lines import get_list_of_lines
-from utils.extract_data_from_file import extract_data_from_file
+from typing import Iterable, List
+from utils.stream_lines_from_file import stream_lines_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class PotentialScenario:
@@ -62,6 +61,7 @@ class ConditionsRecord:
         record = self.original_conditions
         groups = tuple(self.contiguous_groups)
         count = self.count_acceptable_arrangements_recursive_helper(record, groups)
+        ConditionsRecord.count_acceptable_arrangements_recursive_helper.cache_clear()
         return count
 
     @cache
@@ -124,57 +124,45 @@ class ConditionsRecord:
         return violates_pattern
 
 
-class RecordsCollection:
-    def __init__(self, record_descriptions: List[str]) -> None:
-        self.records = self.create_records(record_descriptions)
-        self.unfolded_records = self.unfold_records(record_descriptions)
-
-    def create_records(self, descriptions: List[str]) -> List[ConditionsRecord]:
-        records: List[ConditionsRecord] = []
-        for description in descriptions:
-            records.append(ConditionsRecord(description))
-        return records
-
-    def unfold_records(self, descriptions: List[str]) -> List[ConditionsRecord]:
-        records: List[ConditionsRecord] = []
-        for description in descriptions:
-            parts = description.split(" ")
-            conditions = parts[0]
-            counts = parts[1]
-            final_conditions = conditions
-            final_counts = counts
-            index = 0
-            while index < 4:
-                final_conditions += "?" + conditions
-                final_counts += "," + counts
-                index += 1
-            final_description = final_conditions + " " + final_counts
-            records.append(ConditionsRecord(final_description))
-        return records
-
-    def calculate_total_arrangements(self) -> int:
-        total = 0
-        for record in self.records:
-            total += record.count_acceptable_arrangements()
-        return total
-
-    def calculate_total_unfolded_arrangements(self) -> int:
-        total = 0
-        for record in self.unfolded_records:
-            total += record.count_acceptable_arrangements_using_recursive_helper()
-        return total
+def unfold_record_description(description: str) -> str:
+    parts = description.split(" ")
+    conditions = parts[0]
+    counts = parts[1]
+    final_conditions = conditions
+    final_counts = counts
+    index = 0
+    while index < 4:
+        final_conditions += "?" + conditions
+        final_counts += "," + counts
+        index += 1
+    final_description = final_conditions + " " + final_counts
+    return final_description
+
+
+def calculate_total_arrangements_of_streamed_records(descriptions: Iterable[str]) -> int:
+    total = 0
+    for description in descriptions:
+        total += ConditionsRecord(description).count_acceptable_arrangements()
+    return total
+
+
+def calculate_total_unfolded_arrangements_of_streamed_records(descriptions: Iterable[str]) -> int:
+    total = 0
+    for description in descriptions:
+        unfolded_record = ConditionsRecord(unfold_record_description(description))
+        total += unfolded_record.count_acceptable_arrangements_using_recursive_helper()
+    return total
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(12, is_official)
-    record_descriptions = get_list_of_lines(data)
-    collection = RecordsCollection(record_descriptions)
-    part_1 = collection.calculate_total_arrangements()
-    part_2 = collection.calculate_total_unfolded_arrangements()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(12, part_1, part_2, execution_time)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    timer.start_phase("part_1")
+    part_1 = calculate_total_arrangements_of_streamed_records(stream_lines_from_file(12, is_official))
+    timer.start_phase("part_2")
+    part_2 = calculate_total_unfolded_arrangements_of_streamed_records(stream_lines_from_file(12, is_official))
+    execution_time = timer.stop()
+    results = SolutionResults(12, part_1, part_2, execution_time, timer.phases)
     return results
 
 # CREDIT: https://advent-of-code.xavd.id/writeups/2023/day/12/
@@ -0,0 +1,61 @@
+import random
+from typing import List
+
+
+def count_differences_across_line(rows: List[str], line: int) -> int:
+    differences = 0
+    preceding_index = line - 1
+    succeeding_index = line
+    while preceding_index >= 0 and succeeding_index < len(rows):
+        differences += sum(first != second for first, second in zip(rows[preceding_index], rows[succeeding_index]))
+        preceding_index -= 1
+        succeeding_index += 1
+    return differences
+
+
+def count_lines_with_differences(rows: List[str], required_differences: int) -> int:
+    columns = ["".join(column) for column in zip(*rows)]
+    count = 0
+    for dimension in [rows, columns]:
+        for line in range(1, len(dimension)):
+            if count_differences_across_line(dimension, line) == required_differences:
+                count += 1
+    return count
+
+
+def reflect(index: int, line: int, size: int) -> int:
+    reflected_index = 2 * line - 1 - index
+    return reflected_index if 0 <= reflected_index < size else index
+
+
+def generate_pattern(randomizer: random.Random) -> str:
+    rows: List[str] = []
+    while count_lines_with_differences(rows, 0) != 1 or count_lines_with_differences(rows, 1) != 1:
+        height = randomizer.randint(7, 17)
+        width = randomizer.randint(7, 17)
+        horizontal_line = randomizer.choice([line for line in range(1, height) if 2 * line != height])
+        vertical_line = randomizer.randint(1, width - 1)
+        cells = [[""] * width for _ in range(height)]
+        for row in range(height):
+            for column in range(width):
+                if not cells[row][column]:
+                    value = randomizer.choice("#.")
+                    reflected_row = reflect(row, horizontal_line, height)
+                    reflected_column = reflect(column, vertical_line, width)
+                    for orbit_row, orbit_column in [(row, column), (reflected_row, column), (row, reflected_column), (reflected_row, reflected_column)]:
+                        cells[orbit_row][orbit_column] = value
+        unreflected_rows = [row for row in range(height) if reflect(row, horizontal_line, height) == row]
+        reflected_columns = [column for column in range(width) if reflect(column, vertical_line, width) != column]
+        smudge_row = randomizer.choice(unreflected_rows)
+        smudge_column = randomizer.choice(reflected_columns)
+        cells[smudge_row][smudge_column] = "." if cells[smudge_row][smudge_column] == "#" else "#"
+        rows = ["".join(row) for row in cells]
+        if randomizer.random() < 0.5:
+            rows = ["".join(column) for column in zip(*rows)]
+    return "\n".join(rows)
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    patterns = [generate_pattern(randomizer) for _ in range(100 * scale)]
+    return "\n\n".join(patterns)
@@ -1,7 +1,10 @@
-import time
+from functools import cached_property
 from typing import List
 from utils.extract_data_from_file import extract_data_from_file
+from utils.NumpyGrid import NumpyGrid, numpy_grid_settings
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Pattern:
@@ -10,6 +13,18 @@ class Pattern:
         self.rows = self.determine_rows()
         self.columns = self.determine_columns()
 
+    @cached_property
+    def numpy_grid(self) -> NumpyGrid:
+        return NumpyGrid(self.rows)
+
+    @cached_property
+    def mirrored_row_differences(self) -> List[int]:
+        return self.numpy_grid.count_mirrored_differences(False)
+
+    @cached_property
+    def mirrored_column_differences(self) -> List[int]:
+        return self.numpy_grid.count_mirrored_differences(True)
+
     def determine_rows(self) -> List[str]:
         rows = self.notes.split("\n")
         return rows
@@ -29,11 +44,22 @@ class Pattern:
         return value_of_symmetry
 
     def find_horizontal_line_of_symmetry(self, required_differences: int) -> int:
+        if numpy_grid_settings.enabled:
+            return self.find_line_of_symmetry_with_numpy(required_differences, False)
         return self.find_line_of_symmetry_with_differences(self.rows, required_differences)
 
     def find_vertical_line_of_symmetry(self, required_differences: int) -> int:
+        if numpy_grid_settings.enabled:
+            return self.find_line_of_symmetry_with_numpy(required_differences, True)
         return self.find_line_of_symmetry_with_differences(self.columns, required_differences)
 
+    def find_line_of_symmetry_with_numpy(self, required_differences: int, along_columns: bool) -> int:
+        mirrored_differences = self.mirrored_column_differences if along_columns else self.mirrored_row_differences
+        for line in range(1, len(mirrored_differences) + 1):
+            if mirrored_differences[line - 1] == required_differences:
+                return line
+        return 0
+
     def find_line_of_symmetry_with_differences(self, dimension: List[str], required_differences: int) -> int:
         line_index = 0
         current_index = 0
@@ -78,12 +104,13 @@ class Collection:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(13, is_official)
-    collection = Collection(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    collection = parse_cache.load_or_parse(13, is_official, lambda: Collection(extract_data_from_file(13, is_official)))
+    timer.start_phase("part_1")
     part_1 = collection.calculate_total_values_of_symmetry(0)
+    timer.start_phase("part_2")
     part_2 = collection.calculate_total_values_of_symmetry(1)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(13, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(13, part_1, part_2, execution_time, timer.phases)
     return results
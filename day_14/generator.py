@@ -0,0 +1,46 @@
+import random
+from typing import List
+
+
+def roll_north(grid: List[List[str]]) -> None:
+    for column in range(len(grid[0])):
+        free_row = 0
+        for row in range(len(grid)):
+            if grid[row][column] == "#":
+                free_row = row + 1
+            elif grid[row][column] == "O":
+                grid[row][column] = "."
+                grid[free_row][column] = "O"
+                free_row += 1
+
+
+def spin_cycle(grid: List[List[str]]) -> List[List[str]]:
+    for _ in range(4):
+        roll_north(grid)
+        grid = [list(row) for row in zip(*grid[::-1])]
+    return grid
+
+
+def find_spin_cycle_period(rows: List[str], maximum_cycles: int) -> int:
+    grid = [list(row) for row in rows]
+    seen_states: dict[str, int] = {}
+    for cycle in range(maximum_cycles):
+        grid = spin_cycle(grid)
+        state = "".join("".join(row) for row in grid)
+        if state in seen_states:
+            return cycle - seen_states[state]
+        seen_states[state] = cycle
+    return 0
+
+
+def generate_rows(randomizer: random.Random, side: int) -> List[str]:
+    return ["".join(randomizer.choices("O#.", weights=[20, 15, 65], k=side)) for _ in range(side)]
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    side = 20 * scale
+    rows = generate_rows(randomizer, side)
+    while find_spin_cycle_period(rows, 1000) <= 2:
+        rows = generate_rows(randomizer, side)
+    return "\n".join(rows)
@@ -1,8 +1,9 @@
-import time
 from typing import List
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.NumpyGrid import NumpyGrid, numpy_grid_settings, count_by_row
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 def tilt_north(rows: List[str]) -> List[str]:
@@ -71,6 +72,8 @@ def spin_cycle(rows: List[str]) -> List[str]:
 
 
 def calculate_north_load(rows: List[str]) -> int:
+    if numpy_grid_settings.enabled:
+        return calculate_north_load_with_numpy(rows)
     reversed_rows = list(reversed(rows))
     total = 0
     for index in range(len(reversed_rows)):
@@ -78,6 +81,14 @@ def calculate_north_load(rows: List[str]) -> int:
     return total
 
 
+def calculate_north_load_with_numpy(rows: List[str]) -> int:
+    sphere_counts = count_by_row(NumpyGrid(rows).create_mask("O"))
+    total = 0
+    for index in range(len(sphere_counts)):
+        total += sphere_counts[index] * (len(sphere_counts) - index)
+    return total
+
+
 def calculate_north_load_after_multiple_spin_cycles(rows: List[str], cycles: int) -> int:
     final_rows: List[str] = rows
     loads: List[int] = []
@@ -129,12 +140,14 @@ def find_pattern(integers: List[int]) -> dict[str, int]:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
+    timer = PhaseTimer()
+    timer.start_phase("parse")
     data = extract_data_from_file(14, is_official)
     rows = get_list_of_lines(data)
+    timer.start_phase("part_1")
     part_1 = calculate_north_load(tilt_north(rows))
+    timer.start_phase("part_2")
     part_2 = calculate_north_load_after_multiple_spin_cycles(rows, 1000000000)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(14, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(14, part_1, part_2, execution_time, timer.phases)
     return results
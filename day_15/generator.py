@@ -0,0 +1,9 @@
+import random
+from utils.generate_unique_names import generate_unique_names
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    labels = [name for length in range(2, 7) for name in generate_unique_names(randomizer, 20 * scale, length)]
+    steps = [randomizer.choice(labels) + (f"={randomizer.randint(1, 9)}" if randomizer.random() < 0.6 else "-") for _ in range(2000 * scale)]
+    return ",".join(steps)
@@ -1,7 +1,7 @@
-import time
 from typing import List
 from utils.extract_data_from_file import extract_data_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 def apply_hash_algorithm(input: str) -> int:
@@ -56,17 +56,19 @@ def calculate_total_focusing_power(boxes: dict[int, dict[str, dict[str, int]]])
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
+    timer = PhaseTimer()
+    timer.start_phase("parse")
     data = extract_data_from_file(15, is_official)
     steps = data.split(",")
+    timer.start_phase("part_1")
     sum_hash_values = 0
     for step in steps:
         sum_hash_values += apply_hash_algorithm(step)
+    part_1 = sum_hash_values
+    timer.start_phase("part_2")
     final_boxes = move_lenses(steps)
     total_focusing_power = calculate_total_focusing_power(final_boxes)
-    part_1 = sum_hash_values
     part_2 = total_focusing_power
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(15, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(15, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,8 @@
+import random
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    side = 20 * scale
+    rows = ["".join(randomizer.choices(".|-/\\", weights=[90, 3, 3, 2, 2], k=side)) for _ in range(side)]
+    return "\n".join(rows)
@@ -1,8 +1,9 @@
-import time
 from typing import List
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Beam:
@@ -120,12 +121,13 @@ class Contraption:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(16, is_official)
-    grid = Contraption(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    grid = parse_cache.load_or_parse(16, is_official, lambda: Contraption(extract_data_from_file(16, is_official)))
+    timer.start_phase("part_1")
     part_1 = grid.count_energized_tiles_for_configuration(0, 0, True, True)
+    timer.start_phase("part_2")
     part_2 = grid.maximize_energized_tiles()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(16, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(16, part_1, part_2, execution_time, timer.phases)
     return results
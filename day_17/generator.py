@@ -0,0 +1,8 @@
+import random
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    side = 20 * scale
+    rows = ["".join(randomizer.choices("123456789", k=side)) for _ in range(side)]
+    return "\n".join(rows)
@@ -1,33 +1,30 @@
-import time
 import heapq
 from typing import List, Tuple, Set
-from utils.get_list_of_lines import get_list_of_lines
-from utils.extract_data_from_file import extract_data_from_file
+from utils.map_data_from_file import map_data_from_file
+from utils.MappedInput import MappedInput
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class City:
-    def __init__(self, description: str) -> None:
-        self.rows = get_list_of_lines(description)
-        self.height = self.calculate_height()
-        self.width = self.calculate_width()
-        self.blocks = self.create_blocks()
+    def __init__(self, mapped_input: MappedInput) -> None:
+        self.height = mapped_input.height
+        self.width = mapped_input.width
+        self.blocks = self.create_blocks(mapped_input)
         self.start = 0, 0
         self.end = self.width - 1, self.height - 1
 
-    def calculate_height(self) -> int:
-        return len(self.rows)
-
-    def calculate_width(self) -> int:
-        return len(self.rows[0])
-
-    def create_blocks(self) -> dict[Tuple[int, int], int]:
+    def create_blocks(self, mapped_input: MappedInput) -> dict[Tuple[int, int], int]:
         blocks: dict[Tuple[int, int], int] = {}
+        zero = ord("0")
         for row in range(self.height):
+            digits = mapped_input.get_row(row)
             for column in range(self.width):
-                heat_loss = int(self.rows[row][column])
+                heat_loss = digits[column] - zero
                 coordinates = column, row
                 blocks[coordinates] = heat_loss
+            digits.release()
         return blocks
 
     def minimize_heat_loss(self, least_steps: int, most_steps: int) -> int:
@@ -53,15 +50,22 @@ class City:
         return 0
 
 
+def create_city(is_official: bool) -> City:
+    with map_data_from_file(17, is_official) as mapped_input:
+        city = City(mapped_input)
+    return city
+
+
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(17, is_official)
-    city = City(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    city = parse_cache.load_or_parse(17, is_official, lambda: create_city(is_official))
+    timer.start_phase("part_1")
     part_1 = city.minimize_heat_loss(1, 3)
+    timer.start_phase("part_2")
     part_2 = city.minimize_heat_loss(4, 10)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(17, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(17, part_1, part_2, execution_time, timer.phases)
     return results
 
 # CREDIT: https://www.reddit.com/r/adventofcode/comments/18k9ne5/comment/kdq86mr/
@@ -0,0 +1,42 @@
+import random
+from typing import List, Tuple
+
+direction_codes = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+
+def generate_distinct_neighbors(randomizer: random.Random, count: int, minimum: int, maximum: int) -> List[int]:
+    values = [randomizer.randint(minimum, maximum)]
+    while len(values) < count:
+        value = randomizer.randint(minimum, maximum)
+        if value != values[-1]:
+            values.append(value)
+    return values
+
+
+def trace_histogram_outline(randomizer: random.Random, columns: int, maximum_width: int, maximum_height: int) -> List[Tuple[str, int]]:
+    widths = [randomizer.randint(1, maximum_width) for _ in range(columns)]
+    tops = generate_distinct_neighbors(randomizer, columns, 1, maximum_height)
+    bottoms = generate_distinct_neighbors(randomizer, columns, -maximum_height, -1)
+    moves: List[Tuple[str, int]] = []
+    for index in range(columns):
+        moves.append(("R", widths[index]))
+        if index < columns - 1:
+            moves.append(("U" if tops[index + 1] > tops[index] else "D", abs(tops[index + 1] - tops[index])))
+    moves.append(("D", tops[-1] - bottoms[-1]))
+    for index in reversed(range(columns)):
+        moves.append(("L", widths[index]))
+        if index > 0:
+            moves.append(("U" if bottoms[index - 1] > bottoms[index] else "D", abs(bottoms[index - 1] - bottoms[index])))
+    moves.append(("U", tops[0] - bottoms[0]))
+    return moves
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    columns = 50 * scale
+    plain_moves = trace_histogram_outline(randomizer, columns, 10, 100)
+    color_moves = trace_histogram_outline(randomizer, columns, 50000, 500000)
+    steps: List[str] = []
+    for (direction, length), (color_direction, color_length) in zip(plain_moves, color_moves):
+        steps.append(f"{direction} {length} (#{color_length:05x}{direction_codes[color_direction]})")
+    return "\n".join(steps)
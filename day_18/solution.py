@@ -1,8 +1,8 @@
-import time
 from typing import List, Tuple, Sequence
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 def create_dig_plan(steps: List[str]) -> dict[Tuple[int, int], str]:
@@ -62,15 +62,17 @@ def calculate_area_with_shoelace(vertices: Sequence[Tuple[int, int]]) -> int:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
+    timer = PhaseTimer()
+    timer.start_phase("parse")
     data = extract_data_from_file(18, is_official)
     steps = get_list_of_lines(data)
     plan = create_dig_plan(steps)
+    timer.start_phase("part_1")
     original_vertices = extract_vertices_from_plan(plan)
-    color_vertices = convert_colors_to_vertices(plan)
     part_1 = calculate_area_with_shoelace(original_vertices)
+    timer.start_phase("part_2")
+    color_vertices = convert_colors_to_vertices(plan)
     part_2 = calculate_area_with_shoelace(color_vertices)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(18, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(18, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,55 @@
+import random
+from collections import deque
+from typing import Deque, List, Tuple
+from utils.generate_unique_names import generate_unique_names
+
+Box = dict[str, Tuple[int, int]]
+
+
+def choose_destination(randomizer: random.Random, names: List[str], pending: Deque[Tuple[str, Box]], box: Box, continues_tree: bool = False) -> str:
+    if names and (continues_tree or randomizer.random() < 0.6):
+        destination = names.pop()
+        pending.append((destination, box))
+    else:
+        destination = randomizer.choice("AR")
+    return destination
+
+
+def generate_workflow(randomizer: random.Random, name: str, box: Box, names: List[str], pending: Deque[Tuple[str, Box]]) -> str:
+    rules: List[str] = []
+    for _ in range(randomizer.randint(1, 3)):
+        categories = [category for category in "xmas" if box[category][1] - box[category][0] >= 1]
+        if not categories:
+            break
+        category = randomizer.choice(categories)
+        minimum, maximum = box[category]
+        if randomizer.random() < 0.5:
+            breakpoint = randomizer.randint(minimum + 1, maximum)
+            accepted_box = {**box, category: (minimum, breakpoint - 1)}
+            box = {**box, category: (breakpoint, maximum)}
+            rules.append(f"{category}<{breakpoint}:{choose_destination(randomizer, names, pending, accepted_box)}")
+        else:
+            breakpoint = randomizer.randint(minimum, maximum - 1)
+            accepted_box = {**box, category: (breakpoint + 1, maximum)}
+            box = {**box, category: (minimum, breakpoint)}
+            rules.append(f"{category}>{breakpoint}:{choose_destination(randomizer, names, pending, accepted_box)}")
+    rules.append(choose_destination(randomizer, names, pending, box, not pending))
+    return f"{name}{{{','.join(rules)}}}"
+
+
+def generate_part(randomizer: random.Random) -> str:
+    ratings = ",".join(f"{category}={randomizer.randint(1, 4000)}" for category in "xmas")
+    return f"{{{ratings}}}"
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    names = generate_unique_names(randomizer, 50 * scale, 3, excluded=["in"])
+    pending: Deque[Tuple[str, Box]] = deque([("in", {category: (1, 4000) for category in "xmas"})])
+    workflows: List[str] = []
+    while pending:
+        name, box = pending.popleft()
+        workflows.append(generate_workflow(randomizer, name, box, names, pending))
+    randomizer.shuffle(workflows)
+    parts = [generate_part(randomizer) for _ in range(200 * scale)]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts)
@@ -1,8 +1,9 @@
-import time
 from typing import List, Callable
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Part:
@@ -27,6 +28,22 @@ class Rule:
         self.destination = elements[1]
         self.evaluation = self.create_evaluation(expression)
 
+    def __getstate__(self) -> dict[str, str | int]:
+        return {
+            "category": self.category,
+            "inequality": self.inequality,
+            "breakpoint": self.breakpoint,
+            "destination": self.destination
+        }
+
+    def __setstate__(self, state: dict[str, str | int]) -> None:
+        self.category = str(state["category"])
+        self.inequality = str(state["inequality"])
+        self.breakpoint = int(state["breakpoint"])
+        self.destination = str(state["destination"])
+        expression = f"{self.category}{self.inequality}{self.breakpoint}" if self.category != "T" else "True"
+        self.evaluation = self.create_evaluation(expression)
+
     def create_evaluation(self, expression: str) -> Callable[[int], bool]:
         if expression != "True":
             return lambda x: eval(expression, {"x": x, "m": x, "a": x, "s": x})
@@ -204,12 +221,13 @@ class Puzzle:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(19, is_official)
-    puzzle = Puzzle(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    puzzle = parse_cache.load_or_parse(19, is_official, lambda: Puzzle(extract_data_from_file(19, is_official)))
+    timer.start_phase("part_1")
     part_1 = puzzle.sum_all_accepted_ratings()
+    timer.start_phase("part_2")
     part_2 = puzzle.count_total_accepted_ratings_combinations()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(19, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(19, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,19 @@
+import random
+from typing import List
+
+colors = ["red", "green", "blue"]
+
+
+def generate_game(randomizer: random.Random, game_id: int) -> str:
+    sets: List[str] = []
+    for _ in range(randomizer.randint(1, 6)):
+        shown_colors = randomizer.sample(colors, randomizer.randint(1, 3))
+        sets.append(", ".join(f"{randomizer.randint(1, 20)} {color}" for color in shown_colors))
+    game = f"Game {game_id}: " + "; ".join(sets)
+    return game
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    games = [generate_game(randomizer, game_id) for game_id in range(1, 100 * scale + 1)]
+    return "\n".join(games)
@@ -1,8 +1,10 @@
-import time
-from typing import List
-from utils.extract_data_from_file import extract_data_from_file
-from utils.get_list_of_lines import get_list_of_lines
+import re
+from array import array
+from utils.map_data_from_file import map_data_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
+
+game_pattern = re.compile(rb"Game (\d+)|(\d+) ([rgb])")
 
 
 class Scenario:
@@ -12,132 +14,64 @@ class Scenario:
         self.blue = blue_value
 
 
-class GameInfo:
-    def __init__(self, id: int, scenarios: List[Scenario]) -> None:
-        self.id = id
-        self.scenarios = scenarios
-
-    def calculate_power_of_game(self) -> int:
-        power = 1
-        color_counts = self.determine_minimum_blocks_required_across_all_scenarios()
-        for value in color_counts.__dict__.values():
-            power *= value
-        return power
-
-    def determine_minimum_blocks_required_across_all_scenarios(self) -> Scenario:
-        max_red = 0
-        max_green = 0
-        max_blue = 0
-        for scenario in self.scenarios:
-            if scenario.red > max_red:
-                max_red = scenario.red
-            if scenario.green > max_green:
-                max_green = scenario.green
-            if scenario.blue > max_blue:
-                max_blue = scenario.blue
-        minimum_blocks_required = Scenario(max_red, max_green, max_blue)
-        return minimum_blocks_required
-
-    def get_game_id_if_all_scenarios_possible(self, color_count_rules: Scenario) -> int:
-        game_id = self.id
-        if self.check_if_any_maximum_exceeded_in_scenarios(color_count_rules):
-            game_id = 0
-        return game_id
-
-    def check_if_any_maximum_exceeded_in_scenarios(self, color_count_rules: Scenario) -> bool:
-        exceeded = False
-        for scenario in self.scenarios:
-            for attr, value in color_count_rules.__dict__.items():
-                if self.check_if_maximum_exceeded_in_scenario(scenario, attr, value):
-                    exceeded = True
-        return exceeded
-
-    def check_if_maximum_exceeded_in_scenario(self, scenario: Scenario, color: str, max: int) -> bool:
-        color_count_in_scenario = getattr(scenario, color)
-        exceeded = color_count_in_scenario > max
-        return exceeded
+class GameColumns:
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.reds = array("q")
+        self.greens = array("q")
+        self.blues = array("q")
+
+    def record_games(self, data: bytes | memoryview) -> None:
+        maximums = {ord("r"): self.reds, ord("g"): self.greens, ord("b"): self.blues}
+        last_index = -1
+        for match in game_pattern.finditer(data):
+            game_id, count, color = match.groups()
+            if game_id is not None:
+                self.ids.append(int(game_id))
+                self.reds.append(0)
+                self.greens.append(0)
+                self.blues.append(0)
+                last_index += 1
+            else:
+                column = maximums[color[0]]
+                value = int(count)
+                if value > column[last_index]:
+                    column[last_index] = value
+
+    def sum_ids_possible_with_rules(self, color_count_rules: Scenario) -> int:
+        id_sum = 0
+        for game_id, red, green, blue in zip(self.ids, self.reds, self.greens, self.blues):
+            if red <= color_count_rules.red and green <= color_count_rules.green and blue <= color_count_rules.blue:
+                id_sum += game_id
+        return id_sum
+
+    def sum_powers(self) -> int:
+        return sum(red * green * blue for red, green, blue in zip(self.reds, self.greens, self.blues))
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(2, is_official)
-    games = get_list_of_lines(data)
-    info_for_all_games = compile_info_for_all_games(games)
-    id_sum = sum_all_ids_possible_with_rules(info_for_all_games)
-    power_sum = sum_powers_of_all_games(info_for_all_games)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(2, id_sum, power_sum, execution_time)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    games = compile_columns_for_all_games(is_official)
+    timer.start_phase("part_1")
+    id_sum = sum_all_ids_possible_with_rules(games)
+    timer.start_phase("part_2")
+    power_sum = sum_powers_of_all_games(games)
+    execution_time = timer.stop()
+    results = SolutionResults(2, id_sum, power_sum, execution_time, timer.phases)
     return results
 
 
-def sum_powers_of_all_games(all_game_infos: List[GameInfo]) -> int:
-    power_sum = 0
-    for game_info in all_game_infos:
-        game_power = game_info.calculate_power_of_game()
-        power_sum += game_power
-    return power_sum
-
-
-def sum_all_ids_possible_with_rules(all_game_infos: List[GameInfo]) -> int:
-    id_sum = 0
-    rules = Scenario(12, 13, 14)
-    for game_info in all_game_infos:
-        game_id = game_info.get_game_id_if_all_scenarios_possible(rules)
-        id_sum += game_id
-    return id_sum
-
-
-def compile_info_for_all_games(games: List[str]) -> List[GameInfo]:
-    all_info: List[GameInfo] = []
-    for game in games:
-        game_info = compile_game_info(game)
-        all_info.append(game_info)
-    return all_info
-
-
-def compile_game_info(game: str) -> GameInfo:
-    main_sections = separate_description_from_sets(game)
-    game_id = determine_game_id(main_sections[0])
-    game_scenarios = determine_block_scenarios_for_game(main_sections[1])
-    game_info = GameInfo(game_id, game_scenarios)
-    return game_info
-
-
-def determine_block_scenarios_for_game(collected_sets: str) -> List[Scenario]:
-    sets = collected_sets.split("; ")
-    block_scenarios: List[Scenario] = []
-    for single_set in sets:
-        block_details = determine_block_details_for_scenario(single_set)
-        block_scenarios.append(block_details)
-    return block_scenarios
-
-
-def determine_block_details_for_scenario(single_set: str) -> Scenario:
-    cubes = single_set.split(", ")
-    red_count = 0
-    green_count = 0
-    blue_count = 0
-    for cube_description in cubes:
-        cube_pieces = cube_description.split(" ")
-        color = cube_pieces[1]
-        count = int(cube_pieces[0])
-        if color == "red":
-            red_count = count
-        elif color == "green":
-            green_count = count
-        elif color == "blue":
-            blue_count = count
-    block_details = Scenario(red_count, green_count, blue_count)
-    return block_details
-
-
-def determine_game_id(description: str) -> int:
-    description_sections = description.split(" ")
-    game_id = int(description_sections[1])
-    return game_id
-
-
-def separate_description_from_sets(game: str) -> List[str]:
-    main_sections = game.split(": ")
-    return main_sections
+def compile_columns_for_all_games(is_official: bool) -> GameColumns:
+    games = GameColumns()
+    with map_data_from_file(2, is_official) as mapped_input:
+        games.record_games(mapped_input.buffer)
+    return games
+
+
+def sum_powers_of_all_games(games: GameColumns) -> int:
+    return games.sum_powers()
+
+
+def sum_all_ids_possible_with_rules(games: GameColumns, color_count_rules: Scenario = Scenario(12, 13, 14)) -> int:
+    return games.sum_ids_possible_with_rules(color_count_rules)
@@ -0,0 +1,49 @@
+import random
+from typing import List
+from utils.generate_unique_names import generate_unique_names
+
+counter_bits = 12
+
+
+def find_counter_periods(randomizer: random.Random, count: int) -> List[int]:
+    candidates = [value for value in range(2**(counter_bits - 1) + 1, 2**counter_bits, 2) if all(value % divisor for divisor in range(3, int(value**0.5) + 1, 2))]
+    return randomizer.sample(candidates, count)
+
+
+def generate_counter(randomizer: random.Random, names: List[str], period: int, output_name: str) -> List[str]:
+    flip_flops = names[:counter_bits]
+    hub, inverter = names[counter_bits:counter_bits + 2]
+    modules: List[str] = []
+    hub_destinations = [flip_flops[0], inverter]
+    for bit in range(counter_bits):
+        destinations = [flip_flops[bit + 1]] if bit < counter_bits - 1 else []
+        if period >> bit & 1:
+            destinations.append(hub)
+        elif bit > 0:
+            hub_destinations.append(flip_flops[bit])
+        randomizer.shuffle(destinations)
+        modules.append(f"%{flip_flops[bit]} -> {', '.join(destinations)}")
+    randomizer.shuffle(hub_destinations)
+    modules.append(f"&{hub} -> {', '.join(hub_destinations)}")
+    modules.append(f"&{inverter} -> {output_name}")
+    return modules
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    counters = 2 + 2 * scale
+    module_count = counters * (counter_bits + 2) + 1
+    names = generate_unique_names(randomizer, module_count, 2 if module_count < 500 else 3, excluded=["rx"])
+    output_name = names.pop()
+    modules: List[str] = []
+    first_flip_flops: List[str] = []
+    inverters: List[str] = []
+    for index, period in enumerate(find_counter_periods(randomizer, counters)):
+        counter_names = names[index * (counter_bits + 2):(index + 1) * (counter_bits + 2)]
+        first_flip_flops.append(counter_names[0])
+        inverters.append(counter_names[counter_bits + 1])
+        modules.extend(generate_counter(randomizer, counter_names, period, output_name))
+    modules.append(f"broadcaster -> {', '.join(first_flip_flops)}")
+    modules.append(f"&{output_name} -> rx")
+    randomizer.shuffle(modules)
+    return "\n".join(modules)
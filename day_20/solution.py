@@ -1,10 +1,11 @@
-import time
 from typing import List, Tuple, Set
 from queue import Queue
 from math import lcm
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Module:
@@ -184,12 +185,13 @@ class Configuration:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(20, is_official)
-    configuration = Configuration(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    configuration = parse_cache.load_or_parse(20, is_official, lambda: Configuration(extract_data_from_file(20, is_official)))
+    timer.start_phase("part_1")
     part_1 = configuration.calculate_pulses_product_for_initial_pushes()
+    timer.start_phase("part_2")
     part_2 = configuration.find_minimal_number_of_pushes_for_output()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(20, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(20, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,21 @@
+import random
+from typing import List
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    half = 10 * scale
+    side = 2 * half + 1
+    rows: List[str] = []
+    for row in range(side):
+        cells: List[str] = []
+        for column in range(side):
+            on_clear_path = row in (0, half, side - 1) or column in (0, half, side - 1) or abs(abs(row - half) + abs(column - half) - half) <= 1
+            if row == half and column == half:
+                cells.append("S")
+            elif not on_clear_path and randomizer.random() < 0.15:
+                cells.append("#")
+            else:
+                cells.append(".")
+        rows.append("".join(cells))
+    return "\n".join(rows)
@@ -1,8 +1,10 @@
-import time
 from typing import Tuple, Set, List
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.NumpyGrid import NumpyGrid, numpy_grid_settings, create_position_mask, spread_mask, tile_mask, count_mask
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class FarmMap:
@@ -55,6 +57,8 @@ class FarmMap:
         return ending_positions
 
     def determine_reachable_plots_after_certain_steps_by_traversal(self, steps: int) -> int:
+        if numpy_grid_settings.enabled:
+            return self.determine_reachable_plots_after_certain_steps_with_numpy(steps)
         current_step = 0
         current_positions: Set[Tuple[int, int]] = set([self.start])
         while current_step < steps:
@@ -62,6 +66,16 @@ class FarmMap:
             current_positions = self.find_all_possible_positions_after_step_with_multiple_starts(current_positions)
         return len(current_positions)
 
+    def determine_reachable_plots_after_certain_steps_with_numpy(self, steps: int) -> int:
+        repeats = 2 * (steps // min(self.height, self.width) + 1) + 1
+        plots = tile_mask(NumpyGrid(self.rows).create_mask(".S"), repeats)
+        start_x, start_y = self.start
+        center = (start_x + self.width * (repeats // 2), start_y + self.height * (repeats // 2))
+        current_positions = create_position_mask(plots.shape, [center])
+        for _ in range(steps):
+            current_positions = spread_mask(current_positions) & plots
+        return count_mask(current_positions)
+
     def determine_reachable_plots_after_certain_steps_by_equation(self, steps: int) -> int:
         remainder = steps % self.height
         equation = self.determine_quadratic_equation_for_positions(remainder)
@@ -111,15 +125,16 @@ def determine_quadratic_coefficients_with_lagrange_interpolation(coordinate_pair
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(21, is_official)
-    farm = FarmMap(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    farm = parse_cache.load_or_parse(21, is_official, lambda: FarmMap(extract_data_from_file(21, is_official)))
     initial_steps = 64 if is_official else 6
     actual_steps = 26501365 if is_official else 5000
+    timer.start_phase("part_1")
     part_1 = farm.determine_reachable_plots_after_certain_steps_by_traversal(initial_steps)
+    timer.start_phase("part_2")
     # EXCEPTION: Code only works for real data, not practice data, since real data features a pattern missing in practice data
     part_2 = farm.determine_reachable_plots_after_certain_steps_by_equation(actual_steps)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(21, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(21, part_1, part_2, execution_time, timer.phases)
     return results
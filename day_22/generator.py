@@ -0,0 +1,26 @@
+import random
+from typing import List, Set, Tuple
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    brick_count = 300 * scale
+    ceiling = brick_count // 3 + 10
+    occupied: Set[Tuple[int, int, int]] = set()
+    snapshots: List[str] = []
+    while len(snapshots) < brick_count:
+        orientation = randomizer.randrange(3)
+        length = randomizer.randint(1, 4)
+        start = [randomizer.randrange(10), randomizer.randrange(10), randomizer.randint(1, ceiling)]
+        end = list(start)
+        end[orientation] += length - 1
+        if end[0] > 9 or end[1] > 9:
+            continue
+        step = [0, 0, 0]
+        step[orientation] = 1
+        cubes = [(start[0] + step[0] * index, start[1] + step[1] * index, start[2] + step[2] * index) for index in range(length)]
+        if any(cube in occupied for cube in cubes):
+            continue
+        occupied.update(cubes)
+        snapshots.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+    return "\n".join(snapshots)
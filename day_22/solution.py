@@ -1,9 +1,10 @@
-import time
-from typing import Tuple, Set, List
+from typing import Any, Tuple, Set, List
 from queue import Queue
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Brick:
@@ -58,6 +59,18 @@ class Stack:
         self.dimensions = self.determine_base_dimensions()
         self.base = self.create_base()
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["bricks_queue"] = list(self.bricks_queue.queue)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        bricks_queue: Queue[List[Tuple[int, int, int, str]]] = Queue()
+        for brick in state.pop("bricks_queue"):
+            bricks_queue.put(brick)
+        self.__dict__.update(state)
+        self.bricks_queue = bricks_queue
+
     def create_bricks(self, snapshots: List[str]) -> dict[str, Brick]:
         bricks: dict[str, Brick] = {}
         for index in range(len(snapshots)):
@@ -210,12 +223,13 @@ class Stack:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(22, is_official)
-    stack = Stack(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    stack = parse_cache.load_or_parse(22, is_official, lambda: Stack(extract_data_from_file(22, is_official)))
+    timer.start_phase("part_1")
     part_1 = stack.count_total_bricks_could_remove()
+    timer.start_phase("part_2")
     part_2 = stack.count_all_bricks_destroyed_in_chain_reaction()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(22, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(22, part_1, part_2, execution_time, timer.phases)
     return results
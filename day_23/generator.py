@@ -0,0 +1,45 @@
+import random
+from typing import List, Tuple
+
+Junction = Tuple[int, int]
+junctions_per_side = 4
+
+
+def choose_trails(randomizer: random.Random) -> List[Tuple[Junction, Junction]]:
+    trails: List[Tuple[Junction, Junction]] = []
+    for column in range(junctions_per_side):
+        for row in range(junctions_per_side):
+            if column < junctions_per_side - 1:
+                trails.append(((column, row), (column + 1, row)))
+            if row < junctions_per_side - 1:
+                trails.append(((column, row), (column, row + 1)))
+    outgoing = {source: 0 for source, _ in trails}
+    incoming = {destination: 0 for _, destination in trails}
+    for source, destination in trails:
+        outgoing[source] += 1
+        incoming[destination] += 1
+    randomizer.shuffle(trails)
+    kept_trails: List[Tuple[Junction, Junction]] = []
+    for source, destination in trails:
+        if outgoing[source] > 1 and incoming[destination] > 1 and randomizer.random() < 0.25:
+            outgoing[source] -= 1
+            incoming[destination] -= 1
+        else:
+            kept_trails.append((source, destination))
+    return kept_trails
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    spacing = 3 + 2 * scale
+    side = (junctions_per_side - 1) * spacing + 3
+    cells = [["#"] * side for _ in range(side)]
+    cells[0][1] = "."
+    cells[side - 1][side - 2] = "."
+    for (column, row), (next_column, next_row) in choose_trails(randomizer):
+        x, y = 1 + column * spacing, 1 + row * spacing
+        dx, dy = next_column - column, next_row - row
+        slope = ">" if dx else "v"
+        for step in range(spacing + 1):
+            cells[y + dy * step][x + dx * step] = slope if step in (1, spacing - 1) else "."
+    return "\n".join("".join(row) for row in cells)
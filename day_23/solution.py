@@ -1,8 +1,9 @@
-import time
 from typing import Tuple, Sequence
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 def create_hiking_map(description: str) -> dict[Tuple[int, int], str]:
@@ -63,13 +64,14 @@ def determine_longest_path_length(hiking_map: dict[Tuple[int, int], str], mindin
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(23, is_official)
-    hiking_map = create_hiking_map(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    hiking_map = parse_cache.load_or_parse(23, is_official, lambda: create_hiking_map(extract_data_from_file(23, is_official)))
+    timer.start_phase("part_1")
     part_1 = determine_longest_path_length(hiking_map, True)
+    timer.start_phase("part_2")
     # EXCEPTION: Brute-force technique requires more than 18 hours to execute with full data before it finds the longest path (no recorded time for how long it takes to verify since it has yet to)
     part_2 = determine_longest_path_length(hiking_map, False)
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(23, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(23, part_1, part_2, execution_time, timer.phases)
     return results
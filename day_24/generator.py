@@ -0,0 +1,21 @@
+import random
+from typing import List
+
+
+def generate_velocity_pool(randomizer: random.Random, excluded: int) -> List[int]:
+    candidates = [velocity for velocity in range(-300, 301) if velocity not in (0, excluded)]
+    return randomizer.sample(candidates, 60)
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    rock_position = [randomizer.randint(10**14, 4 * 10**14) for _ in range(3)]
+    rock_velocity = [randomizer.choice([velocity for velocity in range(-250, 251) if velocity != 0]) for _ in range(3)]
+    velocity_pools = [generate_velocity_pool(randomizer, velocity) for velocity in rock_velocity]
+    collision_times = randomizer.sample(range(10**11, 10**12), 150 * scale)
+    hailstones: List[str] = []
+    for time in collision_times:
+        velocity = [randomizer.choice(pool) for pool in velocity_pools]
+        position = [rock_position[axis] + (rock_velocity[axis] - velocity[axis]) * time for axis in range(3)]
+        hailstones.append(f"{position[0]}, {position[1]}, {position[2]} @ {velocity[0]}, {velocity[1]}, {velocity[2]}")
+    return "\n".join(hailstones)
@@ -1,9 +1,9 @@
-import time
 from math import log10, ceil
 from typing import List, Set
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 def determine_linear_equation_elements(data: str) -> List[List[int]]:
@@ -188,14 +188,16 @@ def calculate_initial_positions_with_cramers_rule(equation_elements: List[List[i
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
+    timer = PhaseTimer()
+    timer.start_phase("parse")
     data = extract_data_from_file(24, is_official)
     equation_elements = determine_linear_equation_elements(data)
     minimum = 200000000000000 if is_official else 7
     maximum = 400000000000000 if is_official else 27
+    timer.start_phase("part_1")
     part_1 = find_all_2d_intersections_within_interval(equation_elements, minimum, maximum)
+    timer.start_phase("part_2")
     part_2 = sum(calculate_initial_positions_with_cramers_rule(equation_elements))
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(24, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(24, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,32 @@
+import random
+from typing import List, Tuple
+from utils.generate_unique_names import generate_unique_names
+
+
+def connect_cluster(randomizer: random.Random, cluster: List[str]) -> List[Tuple[str, str]]:
+    wires: List[Tuple[str, str]] = []
+    for index in range(1, len(cluster)):
+        for neighbor in randomizer.sample(cluster[:index], min(index, 4)):
+            wires.append((cluster[index], neighbor))
+    for _ in range(len(cluster) // 2):
+        first, second = randomizer.sample(cluster, 2)
+        if (first, second) not in wires and (second, first) not in wires:
+            wires.append((first, second))
+    return wires
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    cluster_size = 250 * scale
+    names = generate_unique_names(randomizer, 2 * cluster_size, 3)
+    first_cluster, second_cluster = names[:cluster_size], names[cluster_size:]
+    wires = connect_cluster(randomizer, first_cluster) + connect_cluster(randomizer, second_cluster)
+    wires.extend(zip(randomizer.sample(first_cluster, 3), randomizer.sample(second_cluster, 3)))
+    connections: dict[str, List[str]] = {}
+    for first, second in wires:
+        if randomizer.random() < 0.5:
+            first, second = second, first
+        connections.setdefault(first, []).append(second)
+    lines = [f"{name}: {' '.join(neighbors)}" for name, neighbors in connections.items()]
+    randomizer.shuffle(lines)
+    return "\n".join(lines)
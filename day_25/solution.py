@@ -1,8 +1,9 @@
-import time
 from typing import List, Set, Tuple, Callable
 from utils.get_list_of_lines import get_list_of_lines
 from utils.extract_data_from_file import extract_data_from_file
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Component:
@@ -54,14 +55,15 @@ class WiringDiagram:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(25, is_official)
-    diagram = WiringDiagram(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    diagram = parse_cache.load_or_parse(25, is_official, lambda: WiringDiagram(extract_data_from_file(25, is_official)))
+    timer.start_phase("part_1")
     part_1 = diagram.calculate_product_of_partition_sizes()
+    timer.start_phase("part_2")
     part_2 = 50
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(25, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(25, part_1, part_2, execution_time, timer.phases)
     return results
 
 # CREDIT: https://www.reddit.com/r/adventofcode/comments/18qbsxs/comment/ketzp94/
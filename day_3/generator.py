@@ -0,0 +1,26 @@
+import random
+from typing import List
+from day_3.solution import special_character_values
+
+
+def generate_row(randomizer: random.Random, width: int) -> str:
+    cells: List[str] = []
+    while len(cells) < width:
+        roll = randomizer.random()
+        if roll < 0.12:
+            number = str(randomizer.randint(1, 999))[:width - len(cells)]
+            cells.extend(number)
+            if len(cells) < width:
+                cells.append(".")
+        elif roll < 0.18:
+            cells.append(randomizer.choice(special_character_values))
+        else:
+            cells.append(".")
+    return "".join(cells)
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    side = 20 * scale
+    rows = [generate_row(randomizer, side) for _ in range(side)]
+    return "\n".join(rows)
@@ -1,12 +1,18 @@
-import time
-from typing import List
+import re
+from typing import List, Set
 from utils.extract_data_from_file import extract_data_from_file
 from utils.get_list_of_lines import get_list_of_lines
 from utils.Cell import Cell
 from utils.Grid import Grid
+from utils.NumpyGrid import NumpyGrid, numpy_grid_settings, dilate_mask, find_positions
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 special_character_values = ["@", "#", "$", "%", "&", "*", "-", "+", "=", "/"]
+special_character_codes = frozenset(ord(value) for value in special_character_values)
+digit_codes = frozenset(b"0123456789")
+number_pattern = re.compile(r"\d+")
 
 
 class PartNumber:
@@ -68,68 +74,85 @@ class Gear:
 class Schematic:
     def __init__(self, rows: List[str]) -> None:
         self.grid = Grid(rows)
+        self.number_spans: List[range] = []
+        self.span_ids = self.index_number_spans()
         self.special_characters = self.find_all_special_characters()
         self.part_numbers = self.find_all_part_numbers()
         self.gears = self.find_all_gears()
 
+    def index_number_spans(self) -> List[int]:
+        span_ids = [-1] * len(self.grid.contents)
+        for row in range(self.grid.height):
+            for match in number_pattern.finditer(self.grid.rows[row]):
+                start_index = self.grid.find_index(match.start(), row)
+                span = range(start_index, start_index + match.end() - match.start())
+                for index in span:
+                    span_ids[index] = len(self.number_spans)
+                self.number_spans.append(span)
+        return span_ids
+
     def find_all_gears(self) -> List[Gear]:
         gears: List[Gear] = []
         for cell in self.special_characters:
             if cell.content == "*":
-                adjacent_numerals = self.find_all_adjacent_numeral_cells(cell)
-                if len(adjacent_numerals) >= 2:
-                    adjacent_parts: List[PartNumber] = []
-                    for adjacency in adjacent_numerals:
-                        for part_number in self.part_numbers:
-                            for part_cell in part_number.cells:
-                                if adjacency == part_cell:
-                                    adjacent_parts.append(part_number)
-                    unique_parts = set(adjacent_parts)
-                    listed_parts = list(unique_parts)
-                    if len(listed_parts) == 2:
-                        gear = Gear(cell, listed_parts)
-                        gears.append(gear)
+                adjacent_span_ids = self.find_adjacent_span_ids(cell)
+                if len(adjacent_span_ids) == 2:
+                    listed_parts = [self.create_part_number(span_id) for span_id in sorted(adjacent_span_ids)]
+                    gear = Gear(cell, listed_parts)
+                    gears.append(gear)
         return gears
 
+    def find_adjacent_span_ids(self, core_cell: Cell) -> Set[int]:
+        adjacent_span_ids: Set[int] = set()
+        for adjacent_index in self.grid.get_adjacent_indices(self.grid.find_index(core_cell.x, core_cell.y)):
+            span_id = self.span_ids[adjacent_index]
+            if span_id != -1:
+                adjacent_span_ids.add(span_id)
+        return adjacent_span_ids
+
     def find_all_special_characters(self) -> List[Cell]:
         special_characters: List[Cell] = []
-        for cell in self.grid.cells.values():
-            if cell.content in special_character_values:
-                special_characters.append(cell)
+        contents = self.grid.contents
+        for index in self.grid.iterate_indices():
+            if contents[index] in special_character_codes:
+                special_characters.append(self.grid.get_cell(index))
         return special_characters
 
     def find_all_part_numbers(self) -> List[PartNumber]:
-        part_numbers: List[PartNumber] = []
+        span_ids: Set[int] = set()
         for cell in self.find_all_numeral_cells_adjacent_to_special_character():
-            part_number = self.find_part_number(cell)
-            part_numbers.append(part_number)
-        return list(set(part_numbers))
+            span_ids.add(self.span_ids[self.grid.find_index(cell.x, cell.y)])
+        return [self.create_part_number(span_id) for span_id in sorted(span_ids)]
 
     def find_all_numeral_cells_adjacent_to_special_character(self) -> List[Cell]:
+        if numpy_grid_settings.enabled:
+            return self.find_all_numeral_cells_adjacent_to_special_character_with_numpy()
         adjacent_numerals: List[Cell] = []
         for cell in self.special_characters:
             adjacent_cells = self.find_all_adjacent_numeral_cells(cell)
             adjacent_numerals.extend(adjacent_cells)
         return list(set(adjacent_numerals))
 
+    def find_all_numeral_cells_adjacent_to_special_character_with_numpy(self) -> List[Cell]:
+        numpy_grid = NumpyGrid(self.grid.rows)
+        special_character_mask = numpy_grid.create_mask("".join(special_character_values))
+        adjacent_numeral_mask = numpy_grid.create_digit_mask() & dilate_mask(special_character_mask)
+        return [self.grid.get_cell(self.grid.find_index(x, y)) for x, y in find_positions(adjacent_numeral_mask)]
+
     def find_all_adjacent_numeral_cells(self, core_cell: Cell) -> List[Cell]:
         adjacent_numerals: List[Cell] = []
-        adjacent_cells = self.grid.get_adjacent_cells(core_cell)
-        for adjacent_cell in adjacent_cells:
-            if adjacent_cell.content.isdigit():
-                adjacent_numerals.append(adjacent_cell)
-        return list(set(adjacent_numerals))
+        contents = self.grid.contents
+        for adjacent_index in self.grid.get_adjacent_indices(self.grid.find_index(core_cell.x, core_cell.y)):
+            if contents[adjacent_index] in digit_codes:
+                adjacent_numerals.append(self.grid.get_cell(adjacent_index))
+        return adjacent_numerals
 
     def find_part_number(self, core_cell: Cell) -> PartNumber:
-        cells: List[Cell] = [core_cell]
-        left_cell = self.grid.get_left_cell(core_cell)
-        right_cell = self.grid.get_right_cell(core_cell)
-        while left_cell is not None and left_cell.content.isdigit():
-            cells.insert(0, left_cell)
-            left_cell = self.grid.get_left_cell(left_cell)
-        while right_cell is not None and right_cell.content.isdigit():
-            cells.append(right_cell)
-            right_cell = self.grid.get_right_cell(right_cell)
+        span_id = self.span_ids[self.grid.find_index(core_cell.x, core_cell.y)]
+        return self.create_part_number(span_id)
+
+    def create_part_number(self, span_id: int) -> PartNumber:
+        cells = [self.grid.get_cell(index) for index in self.number_spans[span_id]]
         part_number = PartNumber(cells)
         return part_number
 
@@ -147,13 +170,13 @@ class Schematic:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(3, is_official)
-    rows = get_list_of_lines(data)
-    schematic = Schematic(rows)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    schematic = parse_cache.load_or_parse(3, is_official, lambda: Schematic(get_list_of_lines(extract_data_from_file(3, is_official))))
+    timer.start_phase("part_1")
     part_1 = schematic.calculate_part_numbers_sum()
+    timer.start_phase("part_2")
     part_2 = schematic.calculate_gear_ratios_sum()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(3, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(3, part_1, part_2, execution_time, timer.phases)
     return results
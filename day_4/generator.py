@@ -0,0 +1,26 @@
+import random
+from typing import List
+
+match_weights = [75, 7, 5, 4, 3, 2, 1.5, 1, 0.7, 0.4, 0.4]
+
+
+def format_numbers(numbers: List[int]) -> str:
+    return " ".join(f"{number:>2}" for number in numbers)
+
+
+def generate_card(randomizer: random.Random, card_id: int, id_width: int, remaining_cards: int) -> str:
+    numbers = randomizer.sample(range(1, 100), 35)
+    winning_numbers = numbers[:10]
+    matches = min(randomizer.choices(range(11), weights=match_weights)[0], remaining_cards)
+    provided_numbers = randomizer.sample(winning_numbers, matches) + numbers[10:35 - matches]
+    randomizer.shuffle(provided_numbers)
+    card = f"Card {card_id:>{id_width}}: {format_numbers(winning_numbers)} | {format_numbers(provided_numbers)}"
+    return card
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    card_count = 200 * scale
+    id_width = len(str(card_count))
+    cards = [generate_card(randomizer, card_id, id_width, card_count - card_id) for card_id in range(1, card_count + 1)]
+    return "\n".join(cards)
@@ -0,0 +1,39 @@
+import random
+from typing import List
+
+categories = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+
+
+def generate_conversion_lines(randomizer: random.Random, span: int, chunk_count: int) -> List[str]:
+    boundaries = sorted(randomizer.sample(range(1, span), chunk_count - 1))
+    starts = [0] + boundaries
+    lengths = [end - start for start, end in zip(starts, boundaries + [span])]
+    order = list(range(chunk_count))
+    randomizer.shuffle(order)
+    lines: List[str] = []
+    destination = 0
+    for index in order:
+        lines.append(f"{destination} {starts[index]} {lengths[index]}")
+        destination += lengths[index]
+    randomizer.shuffle(lines)
+    return lines
+
+
+def generate_seeds(randomizer: random.Random, span: int) -> List[int]:
+    seeds: List[int] = []
+    for _ in range(10):
+        length = randomizer.randint(span // 200, span // 50)
+        start = randomizer.randint(0, span - length)
+        seeds.extend([start, length])
+    return seeds
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    span = 50000 * scale
+    chunk_count = 10 * scale
+    sections = ["seeds: " + " ".join(str(value) for value in generate_seeds(randomizer, span))]
+    for source, destination in zip(categories, categories[1:]):
+        lines = generate_conversion_lines(randomizer, span, chunk_count)
+        sections.append(f"{source}-to-{destination} map:\n" + "\n".join(lines))
+    return "\n\n".join(sections)
@@ -1,20 +1,10 @@
-import time
-from typing import List
+from bisect import bisect_right
+from typing import Any, List
 from utils.extract_data_from_file import extract_data_from_file
+from utils.require_numpy import require_numpy
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
-
-
-class ReverseConversion:
-    def __init__(self, description: str, minimum: int | float = 0, maximum: int | float = 0, increment: int = 0) -> None:
-        if description:
-            elements = description.split(" ")
-            self.minimum = int(elements[0])
-            self.maximum = self.minimum + int(elements[2]) - 1
-            self.increment = int(elements[1]) - self.minimum
-        else:
-            self.minimum = minimum
-            self.maximum = maximum
-            self.increment = increment
+from utils.PhaseTimer import PhaseTimer
 
 
 class Conversion:
@@ -52,7 +42,6 @@ class TypeConversions:
         self.source = transformation_parts[0]
         self.destination = transformation_parts[1]
         self.conversions = self.determine_conversions(elements[1])
-        self.reverse_conversions = self.determine_reverse_conversions(elements[1])
 
     def __repr__(self) -> str:
         return f"{self.source} -> {self.destination}\n{self.conversions}"
@@ -67,16 +56,6 @@ class TypeConversions:
         conversions_with_gaps_filled = self.fill_gaps(sorted_conversions)
         return conversions_with_gaps_filled
 
-    def determine_reverse_conversions(self, description: str) -> List[ReverseConversion]:
-        conversion_descriptions = description.split("\n")
-        conversions: List[ReverseConversion] = []
-        for conversion_description in conversion_descriptions:
-            conversion = ReverseConversion(conversion_description)
-            conversions.append(conversion)
-        sorted_conversions = sorted(conversions, key=lambda conversion: conversion.minimum)
-        conversions_with_gaps_filled = self.reverse_fill_gaps(sorted_conversions)
-        return conversions_with_gaps_filled
-
     def convert_value(self, input: int) -> int:
         result = 0
         searched_conversions = 0
@@ -87,15 +66,15 @@ class TypeConversions:
                 searched_conversions += 1
         return result
 
-    def reverse_convert_value(self, input: int) -> int:
-        result = 0
-        searched_conversions = 0
-        while searched_conversions < len(self.reverse_conversions):
-            for conversion in self.reverse_conversions:
-                if input >= conversion.minimum and input <= conversion.maximum:
-                    result = input + conversion.increment
-                searched_conversions += 1
-        return result
+    def convert_ranges(self, input_ranges: List[List[int]]) -> List[List[int]]:
+        output_ranges: List[List[int]] = []
+        for input_range in input_ranges:
+            for conversion in self.conversions:
+                overlap_minimum = max(input_range[0], conversion.minimum)
+                overlap_maximum = min(input_range[1], conversion.maximum)
+                if overlap_minimum <= overlap_maximum:
+                    output_ranges.append([int(overlap_minimum) + conversion.increment, int(overlap_maximum) + conversion.increment])
+        return output_ranges
 
     def fill_gaps(self, initial_conversions: List[Conversion]) -> List[Conversion]:
         final_conversions: List[Conversion] = [Conversion('', float('-inf'), initial_conversions[0].minimum - 1, 0)]
@@ -109,17 +88,34 @@ class TypeConversions:
         final_conversions.append(Conversion('', initial_conversions[-1].maximum + 1, float('inf')))
         return final_conversions
 
-    def reverse_fill_gaps(self, initial_conversions: List[ReverseConversion]) -> List[ReverseConversion]:
-        final_conversions: List[ReverseConversion] = [ReverseConversion('', float('-inf'), initial_conversions[0].minimum - 1, 0)]
-        for i in range(len(initial_conversions) - 1):
-            current_conversion = initial_conversions[i]
-            next_conversion = initial_conversions[i + 1]
-            final_conversions.append(current_conversion)
-            if current_conversion.maximum < next_conversion.minimum - 1:
-                final_conversions.append(ReverseConversion('', current_conversion.maximum + 1, next_conversion.minimum - 1))
-        final_conversions.append(initial_conversions[-1])
-        final_conversions.append(ReverseConversion('', initial_conversions[-1].maximum + 1, float('inf')))
-        return final_conversions
+
+class CompositeConversion:
+    def __init__(self, layers: List[TypeConversions]) -> None:
+        self.pieces = self.compose_layers(layers)
+        self.breakpoints = [piece.minimum for piece in self.pieces]
+        self.increments = [piece.increment for piece in self.pieces]
+
+    def compose_layers(self, layers: List[TypeConversions]) -> List[Conversion]:
+        pieces: List[Conversion] = [Conversion('', float('-inf'), float('inf'), 0)]
+        for layer in layers:
+            composed_pieces: List[Conversion] = []
+            for piece in pieces:
+                for conversion in layer.conversions:
+                    overlap_minimum = max(piece.minimum + piece.increment, conversion.minimum)
+                    overlap_maximum = min(piece.maximum + piece.increment, conversion.maximum)
+                    if overlap_minimum <= overlap_maximum:
+                        composed_pieces.append(Conversion('', overlap_minimum - piece.increment, overlap_maximum - piece.increment, piece.increment + conversion.increment))
+            pieces = composed_pieces
+        return pieces
+
+    def convert_value(self, input: int) -> int:
+        return input + self.increments[bisect_right(self.breakpoints, input) - 1]
+
+    def convert_values(self, inputs: Any) -> Any:
+        numpy = require_numpy()
+        inner_breakpoints = numpy.array(self.breakpoints[1:], dtype=numpy.int64)
+        increments = numpy.array(self.increments, dtype=numpy.int64)
+        return inputs + increments[numpy.searchsorted(inner_breakpoints, inputs, side="right")]
 
 
 class Almanac:
@@ -127,6 +123,7 @@ class Almanac:
         elements = description.split("\n\n")
         self.seeds = self.determine_seeds(elements[0])
         self.type_conversions = self.determine_type_conversions(elements[1:])
+        self.composite_conversion = CompositeConversion(self.determine_conversion_chain())
         self.seed_ranges_checked: dict[str, int] = {}
 
     def __repr__(self) -> str:
@@ -150,15 +147,19 @@ class Almanac:
             type_conversions[conversion.source] = conversion
         return type_conversions
 
+    def determine_conversion_chain(self) -> List[TypeConversions]:
+        chain: List[TypeConversions] = []
+        category = "seed"
+        while category in self.type_conversions:
+            chain.append(self.type_conversions[category])
+            category = self.type_conversions[category].destination
+        return chain
+
     def determine_location_for_seed(self, seed: int) -> int:
-        soil = self.type_conversions["seed"].convert_value(seed)
-        fertilizer = self.type_conversions["soil"].convert_value(soil)
-        water = self.type_conversions["fertilizer"].convert_value(fertilizer)
-        light = self.type_conversions["water"].convert_value(water)
-        temperature = self.type_conversions["light"].convert_value(light)
-        humidity = self.type_conversions["temperature"].convert_value(temperature)
-        location = self.type_conversions["humidity"].convert_value(humidity)
-        return location
+        return self.composite_conversion.convert_value(seed)
+
+    def determine_locations_for_seed_array(self, seeds: Any) -> Any:
+        return self.composite_conversion.convert_values(seeds)
 
     def determine_locations_for_all_seeds(self, seeds: List[int]) -> List[int]:
         locations: List[int] = []
@@ -180,37 +181,26 @@ class Almanac:
         sorted_ranges = sorted(seed_ranges, key=lambda range: range[0])
         return sorted_ranges
 
-    def get_seed_from_location(self, location: int) -> int:
-        humidity = self.type_conversions["humidity"].reverse_convert_value(location)
-        temperature = self.type_conversions["temperature"].reverse_convert_value(humidity)
-        light = self.type_conversions["light"].reverse_convert_value(temperature)
-        water = self.type_conversions["water"].reverse_convert_value(light)
-        fertilizer = self.type_conversions["fertilizer"].reverse_convert_value(water)
-        soil = self.type_conversions["soil"].reverse_convert_value(fertilizer)
-        seed = self.type_conversions["seed"].reverse_convert_value(soil)
-        return seed
-
-    # EXCEPTION: Brute-force technique requires more than a minute to execute with full data
+    def determine_location_ranges_for_seed_ranges(self, seed_ranges: List[List[int]]) -> List[List[int]]:
+        current_ranges = seed_ranges
+        for type_conversion in self.determine_conversion_chain():
+            current_ranges = type_conversion.convert_ranges(current_ranges)
+        return current_ranges
+
     def find_lowest_location_for_existing_seeds(self) -> int:
-        seed_ranges = self.find_all_seed_ranges()
-        location = 0
-        found_seed = False
-        while not found_seed:
-            location += 1
-            matching_seed = self.get_seed_from_location(location)
-            for seed_range in seed_ranges:
-                if matching_seed in range(seed_range[0], seed_range[1]):
-                    found_seed = True
-        return location
+        location_ranges = self.determine_location_ranges_for_seed_ranges(self.find_all_seed_ranges())
+        lowest_location = min(location_range[0] for location_range in location_ranges)
+        return lowest_location
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(5, is_official)
-    almanac = Almanac(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    almanac = parse_cache.load_or_parse(5, is_official, lambda: Almanac(extract_data_from_file(5, is_official)))
+    timer.start_phase("part_1")
     part_1 = almanac.determine_lowest_location(almanac.seeds)
+    timer.start_phase("part_2")
     part_2 = almanac.find_lowest_location_for_existing_seeds()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(5, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(5, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,16 @@
+import random
+from typing import List
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    times: List[int] = []
+    distances: List[int] = []
+    for index in range(2 + scale):
+        time = randomizer.randint(50 if index == 0 else 10, 99)
+        distance = randomizer.randint(time, min(time * time // 4 - 1, 999))
+        times.append(time)
+        distances.append(distance)
+    time_line = "Time:    " + "".join(f"{time:>7}" for time in times)
+    distance_line = "Distance:" + "".join(f"{distance:>7}" for distance in distances)
+    return f"{time_line}\n{distance_line}"
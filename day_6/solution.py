@@ -1,8 +1,8 @@
 import math
-import time
 from typing import List
 from utils.extract_data_from_file import extract_data_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class Race:
@@ -55,12 +55,14 @@ class Summary:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
+    timer = PhaseTimer()
+    timer.start_phase("parse")
     data = extract_data_from_file(6, is_official)
     summary = Summary(data)
+    timer.start_phase("part_1")
     part_1 = summary.calculate_margin_of_error()
+    timer.start_phase("part_2")
     part_2 = summary.single_race.calculate_total_scenarios()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(6, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(6, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,15 @@
+import random
+from typing import List, Set
+from day_7.solution import plain_card_orders
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    hands: List[str] = []
+    seen_cards: Set[str] = set()
+    while len(hands) < 1000 * scale:
+        cards = "".join(randomizer.choice(plain_card_orders) for _ in range(5))
+        if cards not in seen_cards:
+            seen_cards.add(cards)
+            hands.append(f"{cards} {randomizer.randint(1, 1000)}")
+    return "\n".join(hands)
@@ -1,11 +1,16 @@
-import time
-from typing import List
-from utils.extract_data_from_file import extract_data_from_file
-from utils.get_list_of_lines import get_list_of_lines
+from array import array
+from typing import Iterable, List
+from utils.stream_lines_from_file import stream_lines_from_file
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 plain_card_orders = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
 joker_card_orders = ["J", "2", "3", "4", "5", "6", "7", "8", "9", "T", "Q", "K", "A"]
+plain_card_ranks = {card: rank for rank, card in enumerate(plain_card_orders)}
+joker_card_ranks = {card: rank for rank, card in enumerate(joker_card_orders)}
+hand_type_ranks = {(1, 1): 0, (2, 1): 1, (2, 2): 2, (3, 1): 3, (3, 2): 4, (4, 1): 5, (5, 0): 6}
+card_rank_bits = 4
+type_rank_shift = 5 * card_rank_bits
 
 
 class Hand:
@@ -20,67 +25,40 @@ class Hand:
         return f"{self.cards}: {self.bid} -> {self.value}"
 
     def calculate_value(self) -> int:
-        matches = self.determine_matches()
-        value = self.calculate_final_value(matches)
-        return value
+        counts = self.determine_card_counts(False)
+        return self.pack_value(counts, plain_card_ranks)
 
     def calculate_value_with_jokers(self) -> int:
-        matches = self.determine_matches()
-        if "J" in self.cards:
-            if len(matches.items()) == 0:
-                matches["J"] = 2
-            else:
-                if not matches.get("J"):
-                    temp_key = ""
-                    temp_value = 0
-                    for [k, v] in matches.items():
-                        if v > temp_value:
-                            temp_value = v
-                            temp_key = k
-                    highest_match = temp_value + 1
-                    matches[temp_key] = highest_match
-                else:
-                    if len(matches.items()) == 1:
-                        if matches["J"] != 5:
-                            matches["J"] += 1
-                    else:
-                        temp_key = ""
-                        temp_value = 0
-                        for [k, v] in matches.items():
-                            if v > temp_value and k != "J":
-                                temp_value = v
-                                temp_key = k
-                        highest_match = temp_value + matches["J"]
-                        matches[temp_key] = highest_match
-                        del matches["J"]
-        value = self.calculate_final_value(matches)
-        return value
-
-    def determine_matches(self) -> dict[str, int]:
-        sorted_cards = sorted(self.cards)
-        matches: dict[str, int] = {}
-        for index in range(len(sorted_cards) - 1):
-            if sorted_cards[index] == sorted_cards[index + 1]:
-                card = sorted_cards[index]
-                if matches.get(card):
-                    matches[card] += 1
-                else:
-                    matches[card] = 2
-        return matches
-
-    def calculate_final_value(self, matches: dict[str, int]) -> int:
-        value = 0
-        if len(matches.items()) == 0:
-            value = 1
+        counts = self.determine_card_counts(True)
+        jokers = self.cards.count("J")
+        if counts:
+            counts[0] += jokers
         else:
-            for inner_value in matches.values():
-                value += inner_value ** inner_value
+            counts = [jokers]
+        return self.pack_value(counts, joker_card_ranks)
+
+    def determine_card_counts(self, with_jokers: bool) -> List[int]:
+        counts: dict[str, int] = {}
+        for card in self.cards:
+            if not with_jokers or card != "J":
+                counts[card] = counts.get(card, 0) + 1
+        return sorted(counts.values(), reverse=True)
+
+    def pack_value(self, counts: List[int], card_ranks: dict[str, int]) -> int:
+        second_count = counts[1] if len(counts) > 1 else 0
+        value = hand_type_ranks[(counts[0], second_count)] << type_rank_shift
+        for position, card in enumerate(reversed(self.cards)):
+            value |= card_ranks[card] << (position * card_rank_bits)
         return value
 
 
 class CardSet:
-    def __init__(self, description: str) -> None:
-        self.hands = self.determine_hands(description)
+    def __init__(self, descriptions: Iterable[str]) -> None:
+        self.hands = self.determine_hands(descriptions)
+        self.bids = array("q", [hand.bid for hand in self.hands])
+        self.values = array("q", [hand.value for hand in self.hands])
+        self.joker_values = array("q", [hand.joker_value for hand in self.hands])
+        self.bid_bits = max(self.bids, default=0).bit_length()
 
     def __repr__(self) -> str:
         description = ""
@@ -88,24 +66,25 @@ class CardSet:
             description += f"{hand.cards}: {hand.bid} -> {hand.value}\n"
         return description
 
-    def determine_hands(self, description: str) -> List[Hand]:
+    def determine_hands(self, descriptions: Iterable[str]) -> List[Hand]:
         hands: List[Hand] = []
-        inputs = get_list_of_lines(description)
-        for input in inputs:
+        for input in descriptions:
             hand = Hand(input)
             hands.append(hand)
         return hands
 
     def order_hands(self, with_jokers: bool) -> List[Hand]:
-        card_orders = plain_card_orders if not with_jokers else joker_card_orders
-        ordered_hands = sorted(self.hands, key=lambda x: (x.value if not with_jokers else x.joker_value, card_orders.index(x.cards[0]), card_orders.index(x.cards[1]), card_orders.index(x.cards[2]), card_orders.index(x.cards[3]), card_orders.index(x.cards[4])))
-        return ordered_hands
+        values = self.values if not with_jokers else self.joker_values
+        ordered_indices = sorted(range(len(self.hands)), key=values.__getitem__)
+        return [self.hands[index] for index in ordered_indices]
 
     def calculate_winnings(self, with_jokers: bool) -> int:
+        values = self.values if not with_jokers else self.joker_values
+        bid_mask = (1 << self.bid_bits) - 1
+        ranked_keys = sorted([(value << self.bid_bits) | bid for value, bid in zip(values, self.bids)])
         winnings = 0
-        ordered_hands = self.order_hands_without_jokers() if not with_jokers else self.order_hands_with_jokers()
-        for index in range(len(ordered_hands)):
-            winnings += (index + 1) * ordered_hands[index].bid
+        for index in range(len(ranked_keys)):
+            winnings += (index + 1) * (ranked_keys[index] & bid_mask)
         return winnings
 
     def order_hands_without_jokers(self) -> List[Hand]:
@@ -122,12 +101,13 @@ class CardSet:
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(7, is_official)
-    cards = CardSet(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    cards = CardSet(stream_lines_from_file(7, is_official))
+    timer.start_phase("part_1")
     part_1 = cards.calculate_winnings_without_jokers()
+    timer.start_phase("part_2")
     part_2 = cards.calculate_winnings_with_jokers()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(7, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(7, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,49 @@
+import random
+import string
+from typing import List, Set
+
+name_characters = string.ascii_uppercase + string.digits
+plain_endings = [character for character in name_characters if character not in "AZ"]
+
+
+def find_primes(minimum: int, count: int) -> List[int]:
+    primes: List[int] = []
+    candidate = max(minimum, 2)
+    while len(primes) < count:
+        if all(candidate % divisor for divisor in range(2, int(candidate**0.5) + 1)):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def draw_name(randomizer: random.Random, taken: Set[str], endings: List[str]) -> str:
+    name = ""
+    while not name or name in taken:
+        name = randomizer.choice(name_characters) + randomizer.choice(name_characters) + randomizer.choice(endings)
+    taken.add(name)
+    return name
+
+
+def generate_ghost_nodes(randomizer: random.Random, taken: Set[str], cycle_length: int, start_name: str, finish_name: str) -> List[str]:
+    left_rail = [draw_name(randomizer, taken, plain_endings) for _ in range(cycle_length - 1)] + [finish_name]
+    right_rail = [draw_name(randomizer, taken, plain_endings) for _ in range(cycle_length - 1)] + [finish_name]
+    nodes = [f"{start_name} = ({left_rail[0]}, {right_rail[0]})", f"{finish_name} = ({left_rail[0]}, {right_rail[0]})"]
+    for index in range(cycle_length - 1):
+        nodes.append(f"{left_rail[index]} = ({left_rail[index + 1]}, {right_rail[index + 1]})")
+        nodes.append(f"{right_rail[index]} = ({left_rail[index + 1]}, {right_rail[index + 1]})")
+    return nodes
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    instructions = "".join(randomizer.choice("LR") for _ in range(10 * scale + 1))
+    cycle_lengths = find_primes(20 * scale, 6)
+    randomizer.shuffle(cycle_lengths)
+    taken: Set[str] = {"AAA", "ZZZ"}
+    nodes = generate_ghost_nodes(randomizer, taken, cycle_lengths[0], "AAA", "ZZZ")
+    for cycle_length in cycle_lengths[1:]:
+        start_name = draw_name(randomizer, taken, ["A"])
+        finish_name = draw_name(randomizer, taken, ["Z"])
+        nodes.extend(generate_ghost_nodes(randomizer, taken, cycle_length, start_name, finish_name))
+    randomizer.shuffle(nodes)
+    return instructions + "\n\n" + "\n".join(nodes)
@@ -1,9 +1,10 @@
-import time
-from math import lcm
-from typing import List
+from math import gcd, lcm
+from typing import Iterator, List, Set, Tuple
 from utils.extract_data_from_file import extract_data_from_file
 from utils.get_list_of_lines import get_list_of_lines
+from utils.ParseCache import parse_cache
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
 
 
 class DestinationPair:
@@ -30,11 +31,41 @@ class Node:
         return next_node_name
 
 
+class GhostCycle:
+    def __init__(self, tail_length: int, cycle_length: int, finish_steps: List[int]) -> None:
+        self.tail_length = tail_length
+        self.cycle_length = cycle_length
+        self.finish_steps = set(finish_steps)
+        self.cycle_residues = sorted(set(steps % cycle_length for steps in finish_steps if steps > tail_length))
+
+    def is_finish_step(self, steps: int) -> bool:
+        if steps > self.tail_length + self.cycle_length:
+            steps = self.tail_length + (steps - self.tail_length - 1) % self.cycle_length + 1
+        return steps in self.finish_steps
+
+
+def combine_congruences(first_residue: int, first_modulus: int, second_residue: int, second_modulus: int) -> int | None:
+    divisor = gcd(first_modulus, second_modulus)
+    if (second_residue - first_residue) % divisor:
+        return None
+    reduced_modulus = second_modulus // divisor
+    multiplier = (second_residue - first_residue) // divisor * pow(first_modulus // divisor, -1, reduced_modulus) % reduced_modulus
+    return (first_residue + first_modulus * multiplier) % lcm(first_modulus, second_modulus)
+
+
 class Network:
     def __init__(self, description: str) -> None:
         sections = description.split("\n\n")
         self.instructions = sections[0]
         self.nodes = self.determine_nodes(sections[1])
+        self.node_names = list(self.nodes.keys())
+        self.node_ids = {name: node_id for node_id, name in enumerate(self.node_names)}
+        self.left_ids = [self.node_ids[node.destinations.left] for node in self.nodes.values()]
+        self.right_ids = [self.node_ids[node.destinations.right] for node in self.nodes.values()]
+        self.finish_flags = [name[2] == "Z" for name in self.node_names]
+        self.cycle_finish_hits: List[List[Tuple[int, int]]] = []
+        self.cycle_jumps = self.determine_cycle_jumps()
+        self.jump_levels: List[List[int]] = [self.cycle_jumps]
 
     def __repr__(self) -> str:
         representation = f"INSTRUCTIONS: {self.instructions}\n"
@@ -50,6 +81,53 @@ class Network:
             nodes[node.name] = node
         return nodes
 
+    def determine_cycle_jumps(self) -> List[int]:
+        cycle_jumps: List[int] = []
+        for node_id in range(len(self.node_names)):
+            current_id = node_id
+            finish_hits: List[Tuple[int, int]] = []
+            for offset in range(1, len(self.instructions) + 1):
+                current_id = self.take_step(current_id, offset - 1)
+                if self.finish_flags[current_id]:
+                    finish_hits.append((offset, current_id))
+            cycle_jumps.append(current_id)
+            self.cycle_finish_hits.append(finish_hits)
+        return cycle_jumps
+
+    def take_step(self, node_id: int, instruction_index: int) -> int:
+        if self.instructions[instruction_index] == "L":
+            return self.left_ids[node_id]
+        else:
+            return self.right_ids[node_id]
+
+    def find_node_after_cycles(self, node_id: int, cycles: int) -> int:
+        while (1 << len(self.jump_levels)) <= cycles:
+            previous_level = self.jump_levels[-1]
+            self.jump_levels.append([previous_level[target_id] for target_id in previous_level])
+        level = 0
+        while cycles:
+            if cycles & 1:
+                node_id = self.jump_levels[level][node_id]
+            cycles >>= 1
+            level += 1
+        return node_id
+
+    def find_node_after_steps(self, node_name: str, steps: int) -> str:
+        cycles, remaining_steps = divmod(steps, len(self.instructions))
+        node_id = self.find_node_after_cycles(self.node_ids[node_name], cycles)
+        for instruction_index in range(remaining_steps):
+            node_id = self.take_step(node_id, instruction_index)
+        return self.node_names[node_id]
+
+    def iterate_finish_hits(self, start_id: int, step_limit: int | None = None) -> Iterator[Tuple[int, int]]:
+        current_id = start_id
+        completed_steps = 0
+        while step_limit is None or completed_steps < step_limit:
+            for offset, finish_id in self.cycle_finish_hits[current_id]:
+                yield completed_steps + offset, finish_id
+            current_id = self.cycle_jumps[current_id]
+            completed_steps += len(self.instructions)
+
     def find_all_start_nodes(self) -> List[Node]:
         start_nodes: List[Node] = []
         for node in self.nodes.values():
@@ -58,59 +136,72 @@ class Network:
         return start_nodes
 
     def count_steps_from_start_to_finish(self) -> int:
-        current_node = self.nodes["AAA"]
-        steps = 0
-        while current_node.name != "ZZZ":
-            current_direction = self.instructions[steps % len(self.instructions)]
-            next_node_name = current_node.find_next_node(current_direction)
-            current_node = self.nodes[next_node_name]
-            steps += 1
-        return steps
-
-    def determine_steps_pattern_length_from_semi_start_to_semi_finish(self, start_node: Node) -> int:
-        current_node = start_node
-        steps = 0
-        pattern: List[int] = []
-        pattern_determined = False
-        while not pattern_determined:
-            current_direction = self.instructions[steps % len(self.instructions)]
-            next_node_name = current_node.find_next_node(current_direction)
-            current_node = self.nodes[next_node_name]
-            if current_node.name[2] == "Z":
-                starting_index = 0 if len(pattern) == 0 else pattern[-1]
-                change_in_distance = steps - starting_index
-                if len(pattern) > 1:
-                    if change_in_distance != pattern[1] - pattern[0]:
-                        pattern.append(steps)
-                    else:
-                        pattern_determined = True
-                else:
-                    pattern.append(steps)
-            steps += 1
-        length = pattern[1] - pattern[0]
-        return length
-
-    def determine_steps_pattern_lengths_for_all_semi_starts(self) -> List[int]:
-        start_nodes = self.find_all_start_nodes()
-        pattern_lengths: List[int] = []
-        for node in start_nodes:
-            length = self.determine_steps_pattern_length_from_semi_start_to_semi_finish(node)
-            pattern_lengths.append(length)
-        return pattern_lengths
+        finish_id = self.node_ids["ZZZ"]
+        for steps, hit_id in self.iterate_finish_hits(self.node_ids["AAA"]):
+            if hit_id == finish_id:
+                return steps
+        return 0
+
+    def determine_ghost_cycle(self, start_id: int) -> GhostCycle:
+        power = 1
+        cycle_cycles = 1
+        tortoise = start_id
+        hare = self.cycle_jumps[start_id]
+        while tortoise != hare:
+            if power == cycle_cycles:
+                tortoise = hare
+                power *= 2
+                cycle_cycles = 0
+            hare = self.cycle_jumps[hare]
+            cycle_cycles += 1
+        tortoise = start_id
+        hare = self.find_node_after_cycles(start_id, cycle_cycles)
+        tail_cycles = 0
+        while tortoise != hare:
+            tortoise = self.cycle_jumps[tortoise]
+            hare = self.cycle_jumps[hare]
+            tail_cycles += 1
+        tail_length = tail_cycles * len(self.instructions)
+        cycle_length = cycle_cycles * len(self.instructions)
+        finish_steps: List[int] = []
+        for steps, _ in self.iterate_finish_hits(start_id, tail_length + cycle_length):
+            finish_steps.append(steps)
+        return GhostCycle(tail_length, cycle_length, finish_steps)
 
     def find_first_overlap_in_patterns(self) -> int:
-        lengths = self.determine_steps_pattern_lengths_for_all_semi_starts()
-        first_overlap = lcm(*lengths)
-        return first_overlap
+        start_ids = [self.node_ids[node.name] for node in self.find_all_start_nodes()]
+        ghosts = [self.determine_ghost_cycle(start_id) for start_id in start_ids]
+        if not ghosts or any(not ghost.finish_steps for ghost in ghosts):
+            return 0
+        tail_limit = max(ghost.tail_length for ghost in ghosts)
+        for steps, _ in self.iterate_finish_hits(start_ids[0], tail_limit):
+            if steps <= tail_limit and all(ghost.is_finish_step(steps) for ghost in ghosts):
+                return steps
+        residues = {0}
+        modulus = 1
+        for ghost in sorted(ghosts, key=lambda ghost: len(ghost.cycle_residues)):
+            combined_residues: Set[int] = set()
+            for residue in residues:
+                for ghost_residue in ghost.cycle_residues:
+                    combined_residue = combine_congruences(residue, modulus, ghost_residue, ghost.cycle_length)
+                    if combined_residue is not None:
+                        combined_residues.add(combined_residue)
+            residues = combined_residues
+            modulus = lcm(modulus, ghost.cycle_length)
+            if not residues:
+                return 0
+        first_steps = tail_limit + 1
+        return min(first_steps + (residue - first_steps) % modulus for residue in residues)
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(8, is_official)
-    network = Network(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    network = parse_cache.load_or_parse(8, is_official, lambda: Network(extract_data_from_file(8, is_official)))
+    timer.start_phase("part_1")
     part_1 = network.count_steps_from_start_to_finish()
+    timer.start_phase("part_2")
     part_2 = network.find_first_overlap_in_patterns()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(8, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(8, part_1, part_2, execution_time, timer.phases)
     return results
@@ -0,0 +1,14 @@
+import random
+
+
+def generate_history(randomizer: random.Random, length: int) -> str:
+    degree = randomizer.randint(1, 8)
+    coefficients = [randomizer.randint(-3, 3) for _ in range(degree + 1)]
+    values = [sum(coefficient * position**power for power, coefficient in enumerate(coefficients)) for position in range(length)]
+    return " ".join(str(value) for value in values)
+
+
+def generate_input(scale: int, seed: int = 0) -> str:
+    randomizer = random.Random(seed)
+    histories = [generate_history(randomizer, 21) for _ in range(200 * scale)]
+    return "\n".join(histories)
@@ -1,90 +1,82 @@
-import time
-from typing import List
-from utils.get_list_of_lines import get_list_of_lines
+from functools import cache
+from math import comb
+from typing import Iterable, List, Tuple
 from utils.extract_data_from_file import extract_data_from_file
+from utils.get_list_of_lines import get_list_of_lines
 from utils.SolutionResults import SolutionResults
+from utils.PhaseTimer import PhaseTimer
+from utils.require_numpy import require_numpy
 
+numpy_minimum_values = 1000000
 
-class History:
-    def __init__(self, summary: str) -> None:
-        self.values = self.determine_values(summary)
-        self.layers = self.generate_all_layers()
-        self.predicted_next = self.predict_next_value()
-        self.predicted_previous = self.predict_previous_value()
-
-    def determine_values(self, summary: str) -> List[int]:
-        extractions = summary.split(" ")
-        values: List[int] = []
-        for extraction in extractions:
-            values.append(int(extraction))
-        return values
 
-    def calculate_differences_at_layer(self, layer: List[int]) -> List[int]:
-        differences: List[int] = []
-        for index in range(len(layer) - 1):
-            differences.append(layer[index + 1] - layer[index])
-        return differences
+@cache
+def determine_extrapolation_weights(length: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    next_weights = tuple((-1) ** (length - 1 - index) * comb(length, index) for index in range(length))
+    previous_weights = tuple((-1) ** index * comb(length, index + 1) for index in range(length))
+    return next_weights, previous_weights
 
-    def check_if_final_layer(self, layer: List[int]) -> bool:
-        zeroes = 0
-        for value in layer:
-            if value == 0:
-                zeroes += 1
-        is_final = True if zeroes == len(layer) else False
-        return is_final
 
-    def generate_all_layers(self) -> List[List[int]]:
-        layers: List[List[int]] = [self.values]
-        is_final = False
-        while not is_final:
-            layers.append(self.calculate_differences_at_layer(layers[-1]))
-            is_final = self.check_if_final_layer(layers[-1])
-        return layers
-
-    def predict_next_value(self) -> int:
-        prediction = 0
-        for layer in self.layers:
-            prediction += layer[-1]
-        return prediction
-
-    def predict_previous_value(self) -> int:
-        prediction = 0
-        for index in range(len(self.layers)):
-            prediction += self.layers[index][0] * ((-1) ** index)
-        return prediction
+def apply_weights(weights: Iterable[int], values: Iterable[int]) -> int:
+    total = 0
+    for weight, value in zip(weights, values):
+        total += weight * value
+    return total
 
 
 class Report:
     def __init__(self, description: str) -> None:
-        self.histories = self.determine_histories(description)
+        self.column_sums = self.determine_column_sums(description)
 
-    def determine_histories(self, description: str) -> List[History]:
-        lines = get_list_of_lines(description)
-        histories: List[History] = []
-        for line in lines:
-            histories.append(History(line))
-        return histories
+    def determine_column_sums(self, description: str) -> dict[int, List[int]]:
+        histories_by_length: dict[int, List[List[int]]] = {}
+        for line in get_list_of_lines(description):
+            values = list(map(int, line.split()))
+            histories_by_length.setdefault(len(values), []).append(values)
+        column_sums: dict[int, List[int]] = {}
+        for length, histories in histories_by_length.items():
+            column_sums[length] = self.sum_columns(histories)
+        return column_sums
 
-    def sum_extrapolated_next_values(self) -> int:
+    def sum_columns(self, histories: List[List[int]]) -> List[int]:
+        numpy = None
+        if len(histories) * len(histories[0]) >= numpy_minimum_values:
+            try:
+                numpy = require_numpy()
+            except ImportError:
+                numpy = None
+        if numpy is not None:
+            try:
+                matrix = numpy.array(histories, dtype=numpy.int64)
+            except OverflowError:
+                matrix = None
+            if matrix is not None and len(histories) * max(int(matrix.max()), -int(matrix.min())) < 2**63:
+                column_sums: List[int] = matrix.sum(axis=0).tolist()
+                return column_sums
+        return [sum(column) for column in zip(*histories)]
+
+    def sum_extrapolated_values(self, is_next: bool) -> int:
         total = 0
-        for history in self.histories:
-            total += history.predicted_next
+        for length, column_sums in self.column_sums.items():
+            weights = determine_extrapolation_weights(length)[0 if is_next else 1]
+            total += apply_weights(weights, column_sums)
         return total
 
+    def sum_extrapolated_next_values(self) -> int:
+        return self.sum_extrapolated_values(True)
+
     def sum_extrapolated_previous_values(self) -> int:
-        total = 0
-        for history in self.histories:
-            total += history.predicted_previous
-        return total
+        return self.sum_extrapolated_values(False)
 
 
 def solve_problem(is_official: bool) -> SolutionResults:
-    start_time = time.time()
-    data = extract_data_from_file(9, is_official)
-    report = Report(data)
+    timer = PhaseTimer()
+    timer.start_phase("parse")
+    report = Report(extract_data_from_file(9, is_official))
+    timer.start_phase("part_1")
     part_1 = report.sum_extrapolated_next_values()
+    timer.start_phase("part_2")
     part_2 = report.sum_extrapolated_previous_values()
-    end_time = time.time()
-    execution_time = end_time - start_time
-    results = SolutionResults(9, part_1, part_2, execution_time)
+    execution_time = timer.stop()
+    results = SolutionResults(9, part_1, part_2, execution_time, timer.phases)
     return results
@@ -1,83 +1,180 @@
 import argparse
+import json
+import sys
 from datetime import date
-from day_1.solution import solve_problem as solve_1
-from day_2.solution import solve_problem as solve_2
-from day_3.solution import solve_problem as solve_3
-from day_4.solution import solve_problem as solve_4
-from day_5.solution import solve_problem as solve_5
-from day_6.solution import solve_problem as solve_6
-from day_7.solution import solve_problem as solve_7
-from day_8.solution import solve_problem as solve_8
-from day_9.solution import solve_problem as solve_9
-from day_10.solution import solve_problem as solve_10
-from day_11.solution import solve_problem as solve_11
-from day_12.solution import solve_problem as solve_12
-from day_13.solution import solve_problem as solve_13
-from day_14.solution import solve_problem as solve_14
-from day_15.solution import solve_problem as solve_15
-from day_16.solution import solve_problem as solve_16
-from day_17.solution import solve_problem as solve_17
-from day_18.solution import solve_problem as solve_18
-from day_19.solution import solve_problem as solve_19
-from day_20.solution import solve_problem as solve_20
-from day_21.solution import solve_problem as solve_21
-from day_22.solution import solve_problem as solve_22
-from day_23.solution import solve_problem as solve_23
-from day_24.solution import solve_problem as solve_24
-from day_25.solution import solve_problem as solve_25
-
-solve_functions_mapper = {
-    1: solve_1,
-    2: solve_2,
-    3: solve_3,
-    4: solve_4,
-    5: solve_5,
-    6: solve_6,
-    7: solve_7,
-    8: solve_8,
-    9: solve_9,
-    10: solve_10,
-    11: solve_11,
-    12: solve_12,
-    13: solve_13,
-    14: solve_14,
-    15: solve_15,
-    16: solve_16,
-    17: solve_17,
-    18: solve_18,
-    19: solve_19,
-    20: solve_20,
-    21: solve_21,
-    22: solve_22,
-    23: solve_23,
-    24: solve_24,
-    25: solve_25,
-}
-
-
-def print_solution_for_day(day: int, is_official: bool) -> None:
-    selected_solve_function = solve_functions_mapper.get(day, solve_1)
+from typing import List
+from utils.DayRegistry import DayRegistry
+from utils.ExecutionTimeRecords import ExecutionTimeRecords
+from utils.SolutionResults import SolutionResults
+
+day_registry = DayRegistry(list(range(1, 25 + 1)))
+
+
+def solve_day(day: int, is_official: bool, memoize: bool = False) -> SolutionResults:
+    if memoize:
+        from utils.ResultStore import result_store
+        cached_solution = result_store.load_results(day, is_official)
+        if cached_solution is not None:
+            return cached_solution
+    selected_solve_function = day_registry.get_solve_function(day)
     solution = selected_solve_function(is_official)
-    print(solution)
+    if memoize:
+        from utils.ResultStore import result_store
+        result_store.store_results(solution, is_official)
+    return solution
+
+
+def format_solution(solution: SolutionResults, as_json: bool) -> str:
+    if as_json:
+        return json.dumps(solution.convert_to_dict())
+    return f"{solution}"
 
 
-def print_solutions_for_all_active_days(is_official: bool) -> None:
+def print_solution_for_day(day: int, is_official: bool, as_json: bool = False, memoize: bool = False) -> None:
+    solution = solve_day(day, is_official, memoize)
+    print(format_solution(solution, as_json))
+    records = ExecutionTimeRecords()
+    records.record_results(solution, is_official)
+    records.save_times()
+
+
+def determine_active_days() -> List[int]:
     current_date = date.today()
     current_day = current_date.day
-    all_days = sorted(solve_functions_mapper.keys())
+    all_days = sorted(day_registry.days)
     active_days = all_days[:current_day]
+    return active_days
+
+
+def print_solutions_for_all_active_days(is_official: bool, as_json: bool = False, memoize: bool = False) -> None:
+    active_days = determine_active_days()
+    for day in active_days:
+        print_solution_for_day(day, is_official, as_json, memoize)
+
+
+def configure_worker(trace_memory: bool, parse_cache_enabled: bool, numpy_grid_enabled: bool) -> None:
+    import tracemalloc
+    from utils.NumpyGrid import numpy_grid_settings
+    from utils.ParseCache import parse_cache
+    if trace_memory:
+        tracemalloc.start()
+    parse_cache.enabled = parse_cache_enabled
+    numpy_grid_settings.enabled = numpy_grid_enabled
+
+
+def print_solutions_for_all_active_days_in_parallel(is_official: bool, jobs: int, as_json: bool = False, memoize: bool = False) -> None:
+    import tracemalloc
+    from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+    from utils.NumpyGrid import numpy_grid_settings
+    from utils.ParseCache import parse_cache
+    active_days = determine_active_days()
+    records = ExecutionTimeRecords()
+    scheduled_days = records.order_longest_expected_first(active_days, is_official)
+    solutions: dict[int, SolutionResults] = {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=configure_worker, initargs=(tracemalloc.is_tracing(), parse_cache.enabled, numpy_grid_settings.enabled)) as executor:
+        futures: dict[Future[SolutionResults], int] = {}
+        for day in scheduled_days:
+            futures[executor.submit(solve_day, day, is_official, memoize)] = day
+        for future in as_completed(futures):
+            day = futures[future]
+            solution = future.result()
+            solutions[day] = solution
+            records.record_results(solution, is_official)
+            if not as_json:
+                print(f"Day {day} completed in {solution.execution_time} seconds")
+    records.save_times()
+    if not as_json:
+        print()
     for day in active_days:
-        print_solution_for_day(day, is_official)
+        print(format_solution(solutions[day], as_json))
+
+
+def print_profiles_for_days(days: List[int], is_official: bool, output_directory: str, top_count: int) -> None:
+    from utils.profile_solution import profile_solution, find_hottest_functions
+    for day in days:
+        selected_solve_function = day_registry.get_solve_function(day)
+        solution, stats = profile_solution(day, selected_solve_function, is_official, output_directory)
+        print(solution)
+        print(f"Profiles written to {output_directory}/day_{day}.prof and {output_directory}/day_{day}.collapsed")
+        print(f"Top {top_count} functions by own time:")
+        for description in find_hottest_functions(stats, top_count):
+            print(f"    {description}")
+        print()
+
+
+def verify_cached_results(sample_size: int, is_official: bool) -> bool:
+    import random
+    from utils.ResultStore import result_store
+    cached_days = result_store.find_cached_days(day_registry.days, is_official)
+    sampled_days = sorted(random.sample(cached_days, min(sample_size, len(cached_days))))
+    all_verified = True
+    for day in sampled_days:
+        cached_solution = result_store.load_results(day, is_official)
+        recomputed_solution = solve_day(day, is_official)
+        if cached_solution is not None and cached_solution.part_1 == recomputed_solution.part_1 and cached_solution.part_2 == recomputed_solution.part_2:
+            print(f"Day {day}: cached results verified")
+        else:
+            print(f"Day {day}: cached results differ from recomputed results, removing cached entry")
+            result_store.remove_results(day, is_official)
+            all_verified = False
+    print(f"Verified {len(sampled_days)} of {len(cached_days)} cached days")
+    return all_verified
+
+
+def print_startup_profile(days: List[int]) -> None:
+    timings = day_registry.profile_startup(days)
+    total_import_time = 0.0
+    for timing in timings:
+        total_import_time += timing.import_time
+        print(timing)
+    print(f"Total import time: {total_import_time} seconds")
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Print solution for day")
     parser.add_argument("day", type=int, choices=range(1, 25 + 1), nargs="?", default=0, help="Select which day's solutions to display")
     parser.add_argument("is_official", choices=["True", "False"], nargs="?", default="True", help="Select True to work with the final data or False to work with the practice data")
+    parser.add_argument("--startup-profile", action="store_true", help="Report the import time of each selected day's solution module instead of solving")
+    parser.add_argument("--jobs", type=int, default=1, help="Solve all active days across this many worker processes, longest expected first")
+    parser.add_argument("--profile", action="store_true", help="Run the selected days under cProfile and a sampling profiler, writing .prof and collapsed-stack files")
+    parser.add_argument("--profile-directory", default="profiles", help="Directory for the files written by --profile")
+    parser.add_argument("--profile-top", type=int, default=10, help="Number of hottest functions to print per day with --profile")
+    parser.add_argument("--trace-memory", action="store_true", help="Trace memory allocations to report the peak memory of each phase (slows execution)")
+    parser.add_argument("--json", action="store_true", help="Print each solution as a JSON object, including its phase breakdown")
+    parser.add_argument("--no-cache", action="store_true", help="Parse each input from scratch instead of loading it from the parse cache")
+    parser.add_argument("--numpy", action="store_true", help="Use the vectorized NumPy grid engine for the grid days that support it (requires NumPy)")
+    parser.add_argument("--memoize", action="store_true", help="Return stored results for days whose input and solver are unchanged, storing new results otherwise")
+    parser.add_argument("--invalidate", type=int, nargs="+", choices=range(1, 25 + 1), metavar="DAY", help="Remove the stored results for these days")
+    parser.add_argument("--invalidate-all", action="store_true", help="Remove the stored results for every day")
+    parser.add_argument("--verify-cache", type=int, metavar="SAMPLE_SIZE", help="Recompute a random sample of days with stored results and check that the answers still match")
     args = parser.parse_args()
+    if args.no_cache:
+        from utils.ParseCache import parse_cache
+        parse_cache.enabled = False
+    if args.numpy:
+        from utils.NumpyGrid import numpy_grid_settings
+        from utils.require_numpy import require_numpy
+        require_numpy()
+        numpy_grid_settings.enabled = True
+    if args.trace_memory:
+        import tracemalloc
+        tracemalloc.start()
     is_official = True if args.is_official == "True" else False
     day = args.day
-    if day:
-        print_solution_for_day(day, is_official)
+    if args.invalidate or args.invalidate_all:
+        from utils.ResultStore import result_store
+        removed = result_store.invalidate_days(day_registry.days if args.invalidate_all else args.invalidate)
+        print(f"Removed {removed} stored results")
+    elif args.verify_cache is not None:
+        if not verify_cached_results(args.verify_cache, is_official):
+            sys.exit(1)
+    elif args.startup_profile:
+        print_startup_profile([day] if day else determine_active_days())
+    elif args.profile:
+        print_profiles_for_days([day] if day else determine_active_days(), is_official, args.profile_directory, args.profile_top)
+    elif day:
+        print_solution_for_day(day, is_official, args.json, args.memoize)
+    elif args.jobs > 1:
+        print_solutions_for_all_active_days_in_parallel(is_official, args.jobs, args.json, args.memoize)
     else:
-        print_solutions_for_all_active_days(is_official)
+        print_solutions_for_all_active_days(is_official, args.json, args.memoize)
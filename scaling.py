@@ -0,0 +1,73 @@
+import argparse
+import json
+import os
+from typing import List, Tuple
+from bench import day_number, positive_integer, time_solution_runs
+from main import day_registry
+from utils.BenchmarkStatistics import BenchmarkStatistics, fit_complexity_exponent, format_nanoseconds
+from utils.fingerprint_input import hash_input_file
+from utils.get_input_path import input_path_overrides
+from utils.ParseCache import parse_cache
+
+ScalingRun = Tuple[int, int, BenchmarkStatistics]
+
+
+def write_generated_input(day: int, scale: int, seed: int) -> str:
+    generator_version = hash_input_file(f"day_{day}/generator.py")[:16]
+    path = f".cache/generated/day_{day}/scale_{scale}_seed_{seed}_{generator_version}.txt"
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = day_registry.get_generate_function(day)(scale, seed)
+        file = open(path, "w")
+        file.write(data)
+        file.close()
+    return path
+
+
+def measure_scaling(day: int, scales: List[int], seed: int, runs: int, warmups: int) -> List[ScalingRun]:
+    scaling_runs: List[ScalingRun] = []
+    for scale in scales:
+        path = write_generated_input(day, scale, seed)
+        input_path_overrides[day] = path
+        try:
+            statistics = time_solution_runs(day, True, runs, warmups)
+        except Exception as error:
+            print(f"Day {day} at scale {scale}: failed with {type(error).__name__}")
+            continue
+        finally:
+            del input_path_overrides[day]
+        input_size = os.path.getsize(path)
+        print(f"Day {day} at scale {scale} ({input_size} bytes): median {format_nanoseconds(statistics.median)}")
+        scaling_runs.append((scale, input_size, statistics))
+    return scaling_runs
+
+
+def summarize_scaling(day: int, scaling_runs: List[ScalingRun]) -> dict[str, object]:
+    summary: dict[str, object] = {
+        "runs": [{"scale": scale, "input_size": input_size, **statistics.convert_to_dict()} for scale, input_size, statistics in scaling_runs]
+    }
+    if len(scaling_runs) > 1:
+        exponent = fit_complexity_exponent([scale for scale, _, _ in scaling_runs], [statistics.median for _, _, statistics in scaling_runs])
+        summary["exponent"] = exponent
+        print(f"Day {day}: time grows as scale^{exponent:.2f}")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark solutions against generated inputs of increasing size")
+    parser.add_argument("days", type=day_number, nargs="*", help="Select which days to benchmark (defaults to every day)")
+    parser.add_argument("--scales", type=positive_integer, nargs="+", default=[1, 2, 4], help="Scale factors passed to each day's input generator")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the input generators")
+    parser.add_argument("--runs", type=positive_integer, default=3, help="Number of timed runs per day and scale")
+    parser.add_argument("--warmups", type=int, default=0, help="Number of untimed runs per day and scale before timing starts")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+    parse_cache.enabled = False
+    selected_days = args.days if args.days else day_registry.days
+    results: dict[str, dict[str, object]] = {}
+    for day in selected_days:
+        results[str(day)] = summarize_scaling(day, measure_scaling(day, sorted(args.scales), args.seed, args.runs, args.warmups))
+    if args.output:
+        file = open(args.output, "w")
+        json.dump({"seed": args.seed, "days": results}, file, indent=4)
+        file.close()
@@ -0,0 +1,34 @@
+import importlib
+import os
+from typing import Iterator, Tuple
+import pytest
+from utils.NumpyGrid import numpy_grid_settings
+from utils.ParseCache import parse_cache
+
+pytest.importorskip("numpy")
+
+numpy_grid_days = [3, 11, 13, 14, 21]
+repository_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def restore_settings(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.chdir(repository_directory)
+    numpy_grid_enabled = numpy_grid_settings.enabled
+    parse_cache_enabled = parse_cache.enabled
+    parse_cache.enabled = False
+    yield
+    numpy_grid_settings.enabled = numpy_grid_enabled
+    parse_cache.enabled = parse_cache_enabled
+
+
+def solve_practice(day: int, numpy_grid_enabled: bool) -> Tuple[int, int]:
+    numpy_grid_settings.enabled = numpy_grid_enabled
+    module = importlib.import_module(f"day_{day}.solution")
+    results = module.solve_problem(False)
+    return results.part_1, results.part_2
+
+
+@pytest.mark.parametrize("day", numpy_grid_days)
+def test_numpy_grid_matches_pure_python(day: int) -> None:
+    assert solve_practice(day, True) == solve_practice(day, False)
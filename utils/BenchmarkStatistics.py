@@ -0,0 +1,46 @@
+import math
+import statistics
+from typing import List
+
+
+class BenchmarkStatistics:
+    def __init__(self, day: int, samples: List[int]) -> None:
+        self.day = day
+        self.samples = sorted(samples)
+        self.runs = len(self.samples)
+        self.minimum = self.samples[0]
+        self.median = statistics.median(self.samples)
+        self.p95 = self.calculate_percentile(95)
+        self.standard_deviation = statistics.stdev(self.samples) if self.runs > 1 else 0.0
+
+    def __repr__(self) -> str:
+        return f"Day {self.day}: min {format_nanoseconds(self.minimum)} | median {format_nanoseconds(self.median)} | p95 {format_nanoseconds(self.p95)} | stddev {format_nanoseconds(self.standard_deviation)} ({self.runs} runs)"
+
+    def calculate_percentile(self, percentile: float) -> float:
+        position = (self.runs - 1) * percentile / 100
+        lower_index = math.floor(position)
+        upper_index = math.ceil(position)
+        lower_value = self.samples[lower_index]
+        upper_value = self.samples[upper_index]
+        value = lower_value + (upper_value - lower_value) * (position - lower_index)
+        return value
+
+    def convert_to_dict(self) -> dict[str, float]:
+        return {
+            "runs": self.runs,
+            "minimum": self.minimum,
+            "median": self.median,
+            "p95": self.p95,
+            "standard_deviation": self.standard_deviation
+        }
+
+
+def format_nanoseconds(nanoseconds: float) -> str:
+    return f"{nanoseconds / 1000000:.3f} ms"
+
+
+def fit_complexity_exponent(scales: List[int], durations: List[float]) -> float:
+    log_scales = [math.log(scale) for scale in scales]
+    log_durations = [math.log(duration) for duration in durations]
+    exponent = statistics.linear_regression(log_scales, log_durations).slope
+    return exponent
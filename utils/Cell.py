@@ -1,4 +1,6 @@
 class Cell:
+    __slots__ = ("x", "y", "content")
+
     def __init__(self, x: int, y: int, content: str) -> None:
         self.x = x
         self.y = y
@@ -0,0 +1,56 @@
+import importlib
+import time
+from typing import Callable, List
+from utils.SolutionResults import SolutionResults
+
+SolveFunction = Callable[[bool], SolutionResults]
+GenerateFunction = Callable[[int, int], str]
+
+
+class ImportTiming:
+    def __init__(self, day: int, module_name: str, import_time: float) -> None:
+        self.day = day
+        self.module_name = module_name
+        self.import_time = import_time
+
+    def __repr__(self) -> str:
+        return f"Day {self.day} ({self.module_name}): {self.import_time} seconds"
+
+
+class DayRegistry:
+    def __init__(self, days: List[int]) -> None:
+        self.days = days
+        self.solve_functions: dict[int, SolveFunction] = {}
+        self.import_timings: dict[int, ImportTiming] = {}
+
+    def determine_module_name(self, day: int) -> str:
+        return f"day_{day}.solution"
+
+    def load_solve_function(self, day: int) -> SolveFunction:
+        module_name = self.determine_module_name(day)
+        start_time = time.perf_counter()
+        module = importlib.import_module(module_name)
+        end_time = time.perf_counter()
+        self.import_timings[day] = ImportTiming(day, module_name, end_time - start_time)
+        solve_function: SolveFunction = getattr(module, "solve_problem")
+        return solve_function
+
+    def get_solve_function(self, day: int) -> SolveFunction:
+        selected_day = day if day in self.days else self.days[0]
+        solve_function = self.solve_functions.get(selected_day)
+        if solve_function is None:
+            solve_function = self.load_solve_function(selected_day)
+            self.solve_functions[selected_day] = solve_function
+        return solve_function
+
+    def get_generate_function(self, day: int) -> GenerateFunction:
+        module = importlib.import_module(f"day_{day}.generator")
+        generate_function: GenerateFunction = getattr(module, "generate_input")
+        return generate_function
+
+    def profile_startup(self, days: List[int]) -> List[ImportTiming]:
+        timings: List[ImportTiming] = []
+        for day in days:
+            self.get_solve_function(day)
+            timings.append(self.import_timings[day])
+        return timings
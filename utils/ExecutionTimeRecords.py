@@ -0,0 +1,43 @@
+import json
+import os
+from typing import List
+from utils.SolutionResults import SolutionResults
+
+
+class ExecutionTimeRecords:
+    def __init__(self, path: str = ".cache/execution_times.json") -> None:
+        self.path = path
+        self.times = self.load_times()
+
+    def load_times(self) -> dict[str, float]:
+        if not os.path.exists(self.path):
+            return {}
+        file = open(self.path, "r")
+        times: dict[str, float] = json.load(file)
+        file.close()
+        return times
+
+    def save_times(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file = open(self.path, "w")
+        json.dump(self.times, file, indent=4, sort_keys=True)
+        file.close()
+
+    def determine_key(self, day: int, is_official: bool) -> str:
+        name = "data" if is_official else "practice"
+        return f"day_{day}/{name}"
+
+    def record_results(self, results: SolutionResults, is_official: bool) -> None:
+        key = self.determine_key(results.day, is_official)
+        self.times[key] = results.execution_time
+
+    def get_expected_time(self, day: int, is_official: bool) -> float:
+        key = self.determine_key(day, is_official)
+        expected_time = self.times.get(key, float("inf"))
+        return expected_time
+
+    def order_longest_expected_first(self, days: List[int], is_official: bool) -> List[int]:
+        ordered_days = sorted(days, key=lambda day: self.get_expected_time(day, is_official), reverse=True)
+        return ordered_days
@@ -1,13 +1,32 @@
-from typing import List
+from functools import cached_property
+from typing import Iterator, List, Tuple
 from utils.Cell import Cell
 
+border_value = 0
+
 
 class Grid:
     def __init__(self, rows: List[str]) -> None:
         self.rows = rows
         self.height = self.calculate_height()
         self.width = self.calculate_width()
-        self.cells = self.create_cells()
+        self.stride = self.width + 2
+        self.contents = self.create_contents()
+        self.neighbor_offsets = self.determine_neighbor_offsets()
+        self.interned_cells: List[Cell | None] = [None] * len(self.contents)
+        self.neighbor_table: List[Tuple[int, ...] | None] = [None] * len(self.contents)
+
+    def __getstate__(self) -> dict[str, object]:
+        state = self.__dict__.copy()
+        del state["interned_cells"]
+        del state["neighbor_table"]
+        state.pop("cells", None)
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self.interned_cells = [None] * len(self.contents)
+        self.neighbor_table = [None] * len(self.contents)
 
     def calculate_height(self) -> int:
         return len(self.rows)
@@ -15,20 +34,64 @@ class Grid:
     def calculate_width(self) -> int:
         return len(self.rows[0])
 
-    def create_cells(self) -> dict[str, Cell]:
-        cells: dict[str, Cell] = {}
+    def create_contents(self) -> bytearray:
+        contents = bytearray([border_value]) * (self.stride * (self.height + 2))
+        for row in range(self.height):
+            start = self.find_index(0, row)
+            contents[start:start + self.width] = self.rows[row].encode()
+        return contents
+
+    def determine_neighbor_offsets(self) -> Tuple[int, ...]:
+        directions = [(0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+        offsets = tuple(y_change * self.stride + x_change for x_change, y_change in directions)
+        return offsets
+
+    def find_index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def find_coordinates(self, index: int) -> Tuple[int, int]:
+        row, column = divmod(index, self.stride)
+        return column - 1, row - 1
+
+    def iterate_indices(self) -> Iterator[int]:
         for row in range(self.height):
-            for column in range(self.width):
-                character = self.rows[row][column]
-                name = f"x{column}y{row}"
-                new_cell = Cell(column, row, character)
-                cells[name] = new_cell
+            start = self.find_index(0, row)
+            yield from range(start, start + self.width)
+
+    def get_content(self, index: int) -> str:
+        return chr(self.contents[index])
+
+    def get_adjacent_indices(self, index: int) -> Tuple[int, ...]:
+        adjacent_indices = self.neighbor_table[index]
+        if adjacent_indices is None:
+            contents = self.contents
+            adjacent_indices = tuple(index + offset for offset in self.neighbor_offsets if contents[index + offset] != border_value)
+            self.neighbor_table[index] = adjacent_indices
+        return adjacent_indices
+
+    def get_cell(self, index: int) -> Cell:
+        cell = self.interned_cells[index]
+        if cell is None:
+            x, y = self.find_coordinates(index)
+            cell = Cell(x, y, self.get_content(index))
+            self.interned_cells[index] = cell
+        return cell
+
+    @cached_property
+    def cells(self) -> dict[str, Cell]:
+        cells: dict[str, Cell] = {}
+        for index in self.iterate_indices():
+            cell = self.get_cell(index)
+            cells[f"x{cell.x}y{cell.y}"] = cell
         return cells
 
     def get_adjacent_cell_in_direction(self, single_cell: Cell, x_change: int, y_change: int) -> Cell | None:
         new_x = single_cell.x + x_change
         new_y = single_cell.y + y_change
-        adjacent_cell = self.cells.get(f"x{new_x}y{new_y}")
+        if 0 <= new_x < self.width and 0 <= new_y < self.height:
+            adjacent_cell = self.get_cell(self.find_index(new_x, new_y))
+        else:
+            adjacent_cell = None
         return adjacent_cell
 
     def get_left_cell(self, single_cell: Cell) -> Cell | None:
@@ -64,29 +127,6 @@ class Grid:
         return br_cell
 
     def get_adjacent_cells(self, single_cell: Cell) -> List[Cell]:
-        cells: List[Cell] = []
-        top_cell = self.get_top_cell(single_cell)
-        bottom_cell = self.get_bottom_cell(single_cell)
-        left_cell = self.get_left_cell(single_cell)
-        right_cell = self.get_right_cell(single_cell)
-        tl_cell = self.get_tl_cell(single_cell)
-        tr_cell = self.get_tr_cell(single_cell)
-        bl_cell = self.get_bl_cell(single_cell)
-        br_cell = self.get_br_cell(single_cell)
-        if top_cell is not None:
-            cells.append(top_cell)
-        if bottom_cell is not None:
-            cells.append(bottom_cell)
-        if left_cell is not None:
-            cells.append(left_cell)
-        if right_cell is not None:
-            cells.append(right_cell)
-        if tl_cell is not None:
-            cells.append(tl_cell)
-        if tr_cell is not None:
-            cells.append(tr_cell)
-        if bl_cell is not None:
-            cells.append(bl_cell)
-        if br_cell is not None:
-            cells.append(br_cell)
+        index = self.find_index(single_cell.x, single_cell.y)
+        cells = [self.get_cell(adjacent_index) for adjacent_index in self.get_adjacent_indices(index)]
         return cells
@@ -0,0 +1,62 @@
+import mmap
+import os
+from types import TracebackType
+from typing import Iterator
+
+
+class MappedInput:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = open(path, "rb")
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.buffer = memoryview(self.mapping) if self.mapping is not None else memoryview(b"")
+        self.width = self.calculate_width()
+        self.row_stride = self.width + 1
+        self.height = self.calculate_height()
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, exception_type: type[BaseException] | None, exception: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
+
+    def calculate_width(self) -> int:
+        if self.mapping is None:
+            return 0
+        first_newline = self.mapping.find(b"\n")
+        width = first_newline if first_newline != -1 else self.size
+        return width
+
+    def calculate_height(self) -> int:
+        if self.size == 0:
+            return 0
+        ends_with_newline = self.buffer[-1] == ord("\n")
+        height = self.size // self.row_stride if ends_with_newline else (self.size + 1) // self.row_stride
+        return height
+
+    def iterate_lines(self) -> Iterator[bytes]:
+        start = 0
+        while self.mapping is not None and start < self.size:
+            end = self.mapping.find(b"\n", start)
+            if end == -1:
+                end = self.size
+            yield self.mapping[start:end]
+            start = end + 1
+
+    def get_row(self, row: int) -> memoryview:
+        start = row * self.row_stride
+        return self.buffer[start:start + self.width]
+
+    def get_byte(self, column: int, row: int) -> int:
+        return self.buffer[row * self.row_stride + column]
+
+    def close(self) -> None:
+        self.buffer.release()
+        if self.mapping is not None:
+            try:
+                self.mapping.close()
+            except BufferError:
+                # Views of self.buffer taken by callers are still alive; the mapping is unmapped once they are released
+                pass
+        self.file.close()
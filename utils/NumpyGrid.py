@@ -0,0 +1,88 @@
+from typing import Any, List, Tuple
+from utils.require_numpy import require_numpy
+
+NumpyArray = Any
+orthogonal_directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+diagonal_directions = [(-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+
+class NumpyGridSettings:
+    def __init__(self) -> None:
+        self.enabled = False
+
+
+numpy_grid_settings = NumpyGridSettings()
+
+
+class NumpyGrid:
+    def __init__(self, rows: List[str]) -> None:
+        engine = require_numpy()
+        self.height = len(rows)
+        self.width = len(rows[0])
+        self.cells = engine.frombuffer("".join(rows).encode(), dtype=engine.uint8).reshape(self.height, self.width)
+
+    def create_mask(self, characters: str) -> NumpyArray:
+        engine = require_numpy()
+        return engine.isin(self.cells, engine.frombuffer(characters.encode(), dtype=engine.uint8))
+
+    def create_digit_mask(self) -> NumpyArray:
+        return (self.cells >= ord("0")) & (self.cells <= ord("9"))
+
+    def count_mirrored_differences(self, along_columns: bool) -> List[int]:
+        engine = require_numpy()
+        cells = self.cells.T if along_columns else self.cells
+        length = len(cells)
+        pair_differences = (cells[:, None, :] != cells[None, :, :]).sum(axis=2)
+        positions = engine.arange(length)
+        anti_diagonal_sums = engine.bincount(engine.add.outer(positions, positions).ravel(), weights=pair_differences.ravel(), minlength=2 * length - 1)
+        return (anti_diagonal_sums[1:2 * length - 2:2].astype(engine.int64) // 2).tolist()
+
+
+def create_position_mask(shape: Tuple[int, int], positions: List[Tuple[int, int]]) -> NumpyArray:
+    engine = require_numpy()
+    mask = engine.zeros(shape, dtype=bool)
+    for x, y in positions:
+        mask[y, x] = True
+    return mask
+
+
+def find_positions(mask: NumpyArray) -> List[Tuple[int, int]]:
+    rows, columns = mask.nonzero()
+    return list(zip(columns.tolist(), rows.tolist()))
+
+
+def shift_mask(mask: NumpyArray, x_change: int, y_change: int) -> NumpyArray:
+    height, width = mask.shape
+    shifted = require_numpy().zeros_like(mask)
+    shifted[max(y_change, 0):height + min(y_change, 0), max(x_change, 0):width + min(x_change, 0)] = mask[max(-y_change, 0):height + min(-y_change, 0), max(-x_change, 0):width + min(-x_change, 0)]
+    return shifted
+
+
+def spread_mask(mask: NumpyArray) -> NumpyArray:
+    spread = require_numpy().zeros_like(mask)
+    for x_change, y_change in orthogonal_directions:
+        spread |= shift_mask(mask, x_change, y_change)
+    return spread
+
+
+def dilate_mask(mask: NumpyArray) -> NumpyArray:
+    dilated = mask.copy()
+    for x_change, y_change in orthogonal_directions + diagonal_directions:
+        dilated |= shift_mask(mask, x_change, y_change)
+    return dilated
+
+
+def tile_mask(mask: NumpyArray, repeats: int) -> NumpyArray:
+    return require_numpy().tile(mask, (repeats, repeats))
+
+
+def count_by_row(mask: NumpyArray) -> List[int]:
+    return mask.sum(axis=1).tolist()
+
+
+def count_by_column(mask: NumpyArray) -> List[int]:
+    return mask.sum(axis=0).tolist()
+
+
+def count_mask(mask: NumpyArray) -> int:
+    return int(mask.sum())
@@ -0,0 +1,80 @@
+import os
+import pickle
+from typing import Callable, List, Tuple, TypeVar
+from utils.fingerprint_input import hash_input_files, determine_code_version
+from utils.get_input_path import get_input_paths
+from utils.NumpyGrid import numpy_grid_settings
+
+ParsedInput = TypeVar("ParsedInput")
+
+
+class ParseCache:
+    def __init__(self, directory: str = ".cache/parsed", maximum_size: int = 512 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.maximum_size = maximum_size
+        self.enabled = True
+
+    def determine_entry_path(self, day_number: int, is_official: bool) -> str:
+        input_hash = hash_input_files(get_input_paths(day_number, is_official))
+        code_version = determine_code_version(day_number)
+        engine = "numpy" if numpy_grid_settings.enabled else "python"
+        return os.path.join(self.directory, f"day_{day_number}_{engine}_{input_hash[:32]}_{code_version[:32]}.pickle")
+
+    def load_or_parse(self, day_number: int, is_official: bool, parse_input: Callable[[], ParsedInput]) -> ParsedInput:
+        if not self.enabled:
+            return parse_input()
+        entry_path = self.determine_entry_path(day_number, is_official)
+        if os.path.exists(entry_path):
+            try:
+                file = open(entry_path, "rb")
+                parsed: ParsedInput = pickle.load(file)
+                file.close()
+                os.utime(entry_path)
+                return parsed
+            except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+                self.remove_entry(entry_path)
+        parsed = parse_input()
+        self.store_entry(entry_path, parsed)
+        return parsed
+
+    def store_entry(self, entry_path: str, parsed: object) -> None:
+        try:
+            serialized = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        file = open(temporary_path, "wb")
+        file.write(serialized)
+        file.close()
+        os.replace(temporary_path, entry_path)
+        self.evict_least_recently_used()
+
+    def remove_entry(self, entry_path: str) -> None:
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+
+    def list_entries(self) -> List[Tuple[float, int, str]]:
+        entries: List[Tuple[float, int, str]] = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(".pickle"):
+                entry_path = os.path.join(self.directory, file_name)
+                status = os.stat(entry_path)
+                entries.append((status.st_mtime, status.st_size, entry_path))
+        return entries
+
+    def evict_least_recently_used(self) -> None:
+        entries = sorted(self.list_entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in entries:
+            if total_size <= self.maximum_size:
+                break
+            self.remove_entry(entry_path)
+            total_size -= size
+
+
+parse_cache = ParseCache()
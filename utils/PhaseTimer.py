@@ -0,0 +1,39 @@
+import time
+import tracemalloc
+
+
+class PhaseMeasurement:
+    def __init__(self, duration: int, peak_memory: int) -> None:
+        self.duration = duration
+        self.peak_memory = peak_memory
+
+    def __repr__(self) -> str:
+        return f"{self.duration} ns, peak memory {self.peak_memory} bytes"
+
+
+class PhaseTimer:
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseMeasurement] = {}
+        self.current_phase = ""
+        self.start_time = time.perf_counter_ns()
+        self.phase_start_time = self.start_time
+
+    def start_phase(self, name: str) -> None:
+        self.finish_current_phase()
+        self.current_phase = name
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self.phase_start_time = time.perf_counter_ns()
+
+    def finish_current_phase(self) -> None:
+        if self.current_phase:
+            phase_end_time = time.perf_counter_ns()
+            peak_memory = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+            self.phases[self.current_phase] = PhaseMeasurement(phase_end_time - self.phase_start_time, peak_memory)
+            self.current_phase = ""
+
+    def stop(self) -> float:
+        self.finish_current_phase()
+        end_time = time.perf_counter_ns()
+        execution_time = (end_time - self.start_time) / 1000000000
+        return execution_time
@@ -0,0 +1,79 @@
+import json
+import os
+from typing import List
+from utils.fingerprint_input import hash_input_files, determine_code_version
+from utils.get_input_path import get_input_paths
+from utils.PhaseTimer import PhaseMeasurement
+from utils.SolutionResults import SolutionResults
+
+phase_names = ["parse", "part_1", "part_2"]
+
+
+class ResultStore:
+    def __init__(self, directory: str = ".cache/results") -> None:
+        self.directory = directory
+
+    def determine_entry_path(self, day: int, is_official: bool) -> str:
+        input_paths = get_input_paths(day, is_official)
+        name = "_".join(os.path.splitext(os.path.basename(path))[0] for path in input_paths)
+        input_hash = hash_input_files(input_paths)
+        code_version = determine_code_version(day)
+        return os.path.join(self.directory, f"day_{day}_{name}_{input_hash[:32]}_{code_version[:32]}.json")
+
+    def load_results(self, day: int, is_official: bool) -> SolutionResults | None:
+        entry_path = self.determine_entry_path(day, is_official)
+        if not os.path.exists(entry_path):
+            return None
+        try:
+            file = open(entry_path, "r")
+            values = json.load(file)
+            file.close()
+            return convert_dict_to_cached_results(values)
+        except (OSError, ValueError, KeyError):
+            os.remove(entry_path)
+            return None
+
+    def store_results(self, results: SolutionResults, is_official: bool) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        entry_path = self.determine_entry_path(results.day, is_official)
+        values = results.convert_to_dict()
+        values["is_cached"] = False
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        file = open(temporary_path, "w")
+        json.dump(values, file, indent=4)
+        file.close()
+        os.replace(temporary_path, entry_path)
+
+    def remove_results(self, day: int, is_official: bool) -> None:
+        entry_path = self.determine_entry_path(day, is_official)
+        if os.path.exists(entry_path):
+            os.remove(entry_path)
+
+    def invalidate_days(self, days: List[int]) -> int:
+        removed = 0
+        if not os.path.isdir(self.directory):
+            return removed
+        prefixes = tuple(f"day_{day}_" for day in days)
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith(prefixes):
+                os.remove(os.path.join(self.directory, file_name))
+                removed += 1
+        return removed
+
+    def find_cached_days(self, days: List[int], is_official: bool) -> List[int]:
+        cached_days: List[int] = []
+        for day in days:
+            if os.path.exists(self.determine_entry_path(day, is_official)):
+                cached_days.append(day)
+        return cached_days
+
+
+def convert_dict_to_cached_results(values: dict[str, int | float]) -> SolutionResults:
+    phases: dict[str, PhaseMeasurement] = {}
+    for name in phase_names:
+        phases[name] = PhaseMeasurement(int(values[f"{name}_time"]), int(values[f"{name}_peak_memory"]))
+    results = SolutionResults(int(values["day"]), int(values["part_1"]), int(values["part_2"]), float(values["execution_time"]), phases, True)
+    return results
+
+
+result_store = ResultStore()
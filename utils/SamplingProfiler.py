@@ -0,0 +1,49 @@
+import os
+import sys
+import threading
+from types import FrameType
+from typing import List
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.stack_counts: dict[str, int] = {}
+        self.target_thread_id = threading.get_ident()
+        self.stopped = threading.Event()
+        self.sampling_thread = threading.Thread(target=self.sample_until_stopped, daemon=True)
+
+    def start(self) -> None:
+        self.target_thread_id = threading.get_ident()
+        self.stopped.clear()
+        self.sampling_thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.sampling_thread.join()
+
+    def sample_until_stopped(self) -> None:
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is not None:
+                self.record_stack(frame)
+
+    def record_stack(self, leaf_frame: FrameType) -> None:
+        labels: List[str] = []
+        frame: FrameType | None = leaf_frame
+        while frame is not None:
+            labels.append(self.describe_frame(frame))
+            frame = frame.f_back
+        collapsed_stack = ";".join(reversed(labels))
+        self.stack_counts[collapsed_stack] = self.stack_counts.get(collapsed_stack, 0) + 1
+
+    def describe_frame(self, frame: FrameType) -> str:
+        code = frame.f_code
+        file_name = os.path.relpath(code.co_filename) if os.path.isabs(code.co_filename) else code.co_filename
+        return f"{code.co_qualname} ({file_name})"
+
+    def write_collapsed_stacks(self, path: str) -> None:
+        file = open(path, "w")
+        for stack, count in sorted(self.stack_counts.items()):
+            file.write(f"{stack} {count}\n")
+        file.close()
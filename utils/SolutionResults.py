@@ -1,9 +1,58 @@
+from utils.PhaseTimer import PhaseMeasurement
+
+
 class SolutionResults:
-    def __init__(self, day: int, part_1: int, part_2: int, execution_time: float) -> None:
+    def __init__(self, day: int, part_1: int, part_2: int, execution_time: float, phases: dict[str, PhaseMeasurement] | None = None, is_cached: bool = False) -> None:
         self.day = day
         self.part_1 = part_1
         self.part_2 = part_2
         self.execution_time = execution_time
+        self.is_cached = is_cached
+        self.phases = phases if phases is not None else {}
+        self.parse_time = self.get_phase_duration("parse")
+        self.part_1_time = self.get_phase_duration("part_1")
+        self.part_2_time = self.get_phase_duration("part_2")
+        self.parse_peak_memory = self.get_phase_peak_memory("parse")
+        self.part_1_peak_memory = self.get_phase_peak_memory("part_1")
+        self.part_2_peak_memory = self.get_phase_peak_memory("part_2")
 
     def __repr__(self) -> str:
-        return f"DAY {self.day} SOLUTIONS\nPart 1: {self.part_1}\nPart 2: {self.part_2}\nTotal execution time: {self.execution_time} seconds"
+        representation = f"DAY {self.day} SOLUTIONS\nPart 1: {self.part_1}\nPart 2: {self.part_2}\nTotal execution time: {self.execution_time} seconds"
+        if self.is_cached:
+            representation += " (cached)"
+        if self.phases:
+            representation += f"\n{self.describe_phase('Parse', self.parse_time, self.parse_peak_memory)}"
+            representation += f"\n{self.describe_phase('Part 1', self.part_1_time, self.part_1_peak_memory)}"
+            representation += f"\n{self.describe_phase('Part 2', self.part_2_time, self.part_2_peak_memory)}"
+        return representation
+
+    def describe_phase(self, label: str, duration: int, peak_memory: int) -> str:
+        description = f"{label} time: {duration} nanoseconds"
+        if peak_memory:
+            description += f" (peak memory: {peak_memory} bytes)"
+        return description
+
+    def get_phase_duration(self, name: str) -> int:
+        phase = self.phases.get(name)
+        duration = phase.duration if phase is not None else 0
+        return duration
+
+    def get_phase_peak_memory(self, name: str) -> int:
+        phase = self.phases.get(name)
+        peak_memory = phase.peak_memory if phase is not None else 0
+        return peak_memory
+
+    def convert_to_dict(self) -> dict[str, int | float | bool]:
+        return {
+            "day": self.day,
+            "part_1": self.part_1,
+            "part_2": self.part_2,
+            "execution_time": self.execution_time,
+            "parse_time": self.parse_time,
+            "part_1_time": self.part_1_time,
+            "part_2_time": self.part_2_time,
+            "parse_peak_memory": self.parse_peak_memory,
+            "part_1_peak_memory": self.part_1_peak_memory,
+            "part_2_peak_memory": self.part_2_peak_memory,
+            "is_cached": self.is_cached
+        }
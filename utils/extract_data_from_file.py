@@ -1,6 +1,8 @@
+from utils.get_input_path import get_input_path
+
+
 def extract_data_from_file(day_number: int, is_official: bool = True) -> str:
-    name = "data" if is_official else "practice"
-    file = open(f"day_{day_number}/{name}.txt", "r")
+    file = open(get_input_path(day_number, is_official), "r")
     data = file.read()
     file.close()
     return data
@@ -0,0 +1,40 @@
+import hashlib
+import os
+from functools import cache
+from typing import List
+
+
+def hash_input_file(path: str) -> str:
+    digest = hashlib.sha256()
+    file = open(path, "rb")
+    chunk = file.read(1048576)
+    while chunk:
+        digest.update(chunk)
+        chunk = file.read(1048576)
+    file.close()
+    return digest.hexdigest()
+
+
+def hash_input_files(paths: List[str]) -> str:
+    if len(paths) == 1:
+        return hash_input_file(paths[0])
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        digest.update(hash_input_file(path).encode())
+    return digest.hexdigest()
+
+
+@cache
+def determine_code_version(day_number: int) -> str:
+    digest = hashlib.sha256()
+    source_paths = [f"day_{day_number}/solution.py"]
+    for file_name in sorted(os.listdir("utils")):
+        if file_name.endswith(".py"):
+            source_paths.append(os.path.join("utils", file_name))
+    for source_path in source_paths:
+        file = open(source_path, "rb")
+        digest.update(source_path.encode())
+        digest.update(file.read())
+        file.close()
+    return digest.hexdigest()
@@ -0,0 +1,14 @@
+import random
+import string
+from typing import Iterable, List, Set
+
+
+def generate_unique_names(randomizer: random.Random, count: int, length: int, alphabet: str = string.ascii_lowercase, excluded: Iterable[str] = ()) -> List[str]:
+    names: List[str] = []
+    taken: Set[str] = set(excluded)
+    while len(names) < count:
+        name = "".join(randomizer.choice(alphabet) for _ in range(length))
+        if name not in taken:
+            taken.add(name)
+            names.append(name)
+    return names
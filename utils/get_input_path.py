@@ -0,0 +1,25 @@
+import os
+from typing import List
+
+input_path_overrides: dict[int, str] = {}
+
+
+def get_input_path(day_number: int, is_official: bool = True, part_number: int = 0) -> str:
+    override = input_path_overrides.get(day_number)
+    if override is not None:
+        return override
+    name = "data" if is_official else f"practice_{part_number}" if part_number else "practice"
+    path = f"day_{day_number}/{name}.txt"
+    return path
+
+
+def get_input_paths(day_number: int, is_official: bool = True) -> List[str]:
+    path = get_input_path(day_number, is_official)
+    if is_official or day_number in input_path_overrides or os.path.exists(path):
+        return [path]
+    paths: List[str] = []
+    part_number = 1
+    while os.path.exists(get_input_path(day_number, is_official, part_number)):
+        paths.append(get_input_path(day_number, is_official, part_number))
+        part_number += 1
+    return paths if paths else [path]
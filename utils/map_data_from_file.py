@@ -0,0 +1,7 @@
+from utils.get_input_path import get_input_path
+from utils.MappedInput import MappedInput
+
+
+def map_data_from_file(day_number: int, is_official: bool = True, part_number: int = 0) -> MappedInput:
+    mapped_input = MappedInput(get_input_path(day_number, is_official, part_number))
+    return mapped_input
@@ -0,0 +1,72 @@
+import ast
+import cProfile
+import os
+import pstats
+from typing import Callable, List, Tuple
+from utils.SamplingProfiler import SamplingProfiler
+from utils.SolutionResults import SolutionResults
+
+FunctionKey = Tuple[str, int, str]
+
+
+def profile_solution(day: int, solve_function: Callable[[bool], SolutionResults], is_official: bool, output_directory: str) -> Tuple[SolutionResults, pstats.Stats]:
+    os.makedirs(output_directory, exist_ok=True)
+    profiler = cProfile.Profile()
+    sampler = SamplingProfiler()
+    sampler.start()
+    profiler.enable()
+    solution = solve_function(is_official)
+    profiler.disable()
+    sampler.stop()
+    profiler.dump_stats(os.path.join(output_directory, f"day_{day}.prof"))
+    sampler.write_collapsed_stacks(os.path.join(output_directory, f"day_{day}.collapsed"))
+    stats = pstats.Stats(profiler)
+    return solution, stats
+
+
+def find_hottest_functions(stats: pstats.Stats, count: int) -> List[str]:
+    qualified_names = QualifiedNameLookup()
+    entries: List[Tuple[float, str]] = []
+    for function_name, function_profile in stats.get_stats_profile().func_profiles.items():
+        name = qualified_names.find_name((function_profile.file_name, function_profile.line_number, function_name))
+        own_time = function_profile.tottime
+        entries.append((own_time, f"{name}: {own_time:.3f} seconds own, {function_profile.cumtime:.3f} seconds cumulative, {function_profile.ncalls} calls"))
+    hottest = sorted(entries, key=lambda entry: entry[0], reverse=True)[:count]
+    return [description for _, description in hottest]
+
+
+class QualifiedNameLookup:
+    def __init__(self) -> None:
+        self.names_by_file: dict[str, dict[int, str]] = {}
+
+    def find_name(self, key: FunctionKey) -> str:
+        file_name, line_number, function_name = key
+        names = self.names_by_file.get(file_name)
+        if names is None:
+            names = self.collect_names(file_name)
+            self.names_by_file[file_name] = names
+        qualified_name = names.get(line_number, function_name)
+        if os.path.isfile(file_name):
+            return f"{qualified_name} ({os.path.relpath(file_name)}:{line_number})"
+        return qualified_name
+
+    def collect_names(self, file_name: str) -> dict[int, str]:
+        names: dict[int, str] = {}
+        if not file_name.endswith(".py") or not os.path.isfile(file_name):
+            return names
+        file = open(file_name, "r")
+        tree = ast.parse(file.read())
+        file.close()
+        self.collect_names_in_body(tree.body, "", names)
+        return names
+
+    def collect_names_in_body(self, body: List[ast.stmt], prefix: str, names: dict[int, str]) -> None:
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualified_name = prefix + node.name
+                names[node.lineno] = qualified_name
+                for decorator in node.decorator_list:
+                    names[decorator.lineno] = qualified_name
+                self.collect_names_in_body(node.body, f"{qualified_name}.<locals>.", names)
+            elif isinstance(node, ast.ClassDef):
+                self.collect_names_in_body(node.body, f"{prefix}{node.name}.", names)
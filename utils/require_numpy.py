@@ -0,0 +1,9 @@
+from typing import Any
+
+
+def require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("This feature needs NumPy installed (pip3 install numpy); run without --numpy to use the pure Python paths") from None
+    return numpy
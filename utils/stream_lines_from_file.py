@@ -0,0 +1,8 @@
+from typing import Iterator
+from utils.get_input_path import get_input_path
+
+
+def stream_lines_from_file(day_number: int, is_official: bool = True, part_number: int = 0) -> Iterator[str]:
+    with open(get_input_path(day_number, is_official, part_number), "r") as file:
+        for line in file:
+            yield line.rstrip("\n")